@@ -0,0 +1,87 @@
+from collections.abc import Collection
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.application.services.admission import (
+    PRIORITY_LARGE_FILE,
+    PRIORITY_SMALL_FILE,
+    PRIORITY_TEXT,
+    AdmissionController,
+    AdmissionRejected,
+)
+from app.core.config import settings
+from app.domain.models.deadline import Deadline
+
+
+def request_deadline(budget_ms: int | None) -> Deadline | None:
+    """Start the request's latency budget; the header may shorten but not extend the default."""
+    default_ms = settings.REQUEST_BUDGET_MS
+    if budget_ms is not None and budget_ms > 0:
+        default_ms = min(budget_ms, default_ms) if default_ms > 0 else budget_ms
+    return Deadline.after_ms(default_ms) if default_ms > 0 else None
+
+
+class AdmissionMiddleware:
+    """Admits compliance analyses before anything reads the request body.
+
+    Priority is decided from the route and ``Content-Length`` alone, so queued uploads
+    hold no memory and oversized ones are refused with 413 without being received. The
+    request deadline starts here as well, so time spent queued counts against the
+    budget; routes pick it up from ``request.state.deadline``.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        admission: AdmissionController,
+        text_paths: Collection[str],
+        upload_paths: Collection[str],
+    ) -> None:
+        self.app = app
+        self.admission = admission
+        self.text_paths = frozenset(text_paths)
+        self.upload_paths = frozenset(upload_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if path in self.text_paths:
+            priority = PRIORITY_TEXT
+        elif path in self.upload_paths:
+            # a missing Content-Length (chunked upload) is treated as a large file
+            size = _int_header(scope, b"content-length")
+            max_body = settings.MAX_UPLOAD_BYTES + settings.UPLOAD_MAX_FIELD_BYTES
+            if size is not None and size > max_body:
+                detail = f"File exceeds maximum upload size of {settings.MAX_UPLOAD_BYTES} bytes"
+                await JSONResponse({"detail": detail}, status_code=413)(scope, receive, send)
+                return
+            small = size is not None and size <= settings.ADMISSION_LARGE_UPLOAD_BYTES
+            priority = PRIORITY_SMALL_FILE if small else PRIORITY_LARGE_FILE
+        else:
+            await self.app(scope, receive, send)
+            return
+
+        deadline = request_deadline(_int_header(scope, b"x-request-budget-ms"))
+        scope.setdefault("state", {})["deadline"] = deadline
+        try:
+            async with self.admission.admit(priority, deadline.remaining() if deadline else None):
+                await self.app(scope, receive, send)
+        except AdmissionRejected as exc:
+            response = JSONResponse(
+                {"detail": str(exc)}, status_code=429, headers={"Retry-After": str(exc.retry_after)}
+            )
+            await response(scope, receive, send)
+
+
+def _int_header(scope: Scope, name: bytes) -> int | None:
+    for key, value in scope["headers"]:
+        if key == name:
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
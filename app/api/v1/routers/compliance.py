@@ -1,13 +1,30 @@
-import os
-import tempfile
-from typing import Annotated
+import hmac
+import random
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse
 
+from app.api.middleware import request_deadline
 from app.application.services.compliance_service import ComplianceApplicationService
+from app.core.config import settings
+from app.domain.models.deadline import Deadline
+from app.domain.models.findings import FindingsFormat
+from app.domain.ports.index import DocumentIndexPort
+from app.infrastructure.adapters.llm_router import RoutingLLMClient
+from app.infrastructure.adapters.multipart_upload import MultipartUploadReader
+from app.infrastructure.adapters.upload_buffer import (
+    UploadBuffer,
+    UploadTimeoutError,
+    UploadTooLargeError,
+)
+from app.infrastructure.profiling import RequestProfiler
 from app.infrastructure.container import get_compliance_service
-from app.models.schemas.compliance_schema import ComplianceRequest, ComplianceResponse
+from app.models.schemas.compliance_schema import (
+    ComplianceRequest,
+    ComplianceResponse,
+    IndexRulesRequest,
+)
 
 router = APIRouter()
 
@@ -15,7 +32,67 @@ router = APIRouter()
 def get_service() -> ComplianceApplicationService:
     return get_compliance_service()
 
+
+def get_index(
+    service: Annotated[ComplianceApplicationService, Depends(get_service)],
+) -> DocumentIndexPort:
+    if service.index is None:
+        raise HTTPException(status_code=404, detail="Document index is not enabled")
+    return service.index
+
+
+def get_deadline(
+    request: Request,
+    budget_ms: Annotated[int | None, Header(alias="X-Request-Budget-Ms")] = None,
+) -> Deadline | None:
+    """The deadline started by ``AdmissionMiddleware``, or a fresh one for other routes."""
+    state = request.scope.get("state", {})
+    if "deadline" in state:
+        return state["deadline"]
+    return request_deadline(budget_ms)
+
+
+def get_profiler(
+    profile: Annotated[str | None, Header(alias="X-Profile")] = None,
+) -> RequestProfiler | None:
+    """Profile this request when ``X-Profile`` carries PROFILE_TOKEN, or when picked by
+    PROFILE_SAMPLE_RATE.
+
+    The service starts and stops the profiler around its own run, so upload streaming
+    and admission queueing are not part of the profile.
+    """
+    requested = (
+        bool(settings.PROFILE_TOKEN)
+        and profile is not None
+        and hmac.compare_digest(profile.encode(), settings.PROFILE_TOKEN.encode())
+    )
+    sampled = settings.PROFILE_SAMPLE_RATE > 0 and random.random() < settings.PROFILE_SAMPLE_RATE
+    if not (requested or sampled):
+        return None
+    return RequestProfiler(
+        settings.PROFILE_OUTPUT_DIR, settings.PROFILE_INTERVAL_MS, settings.PROFILE_MAX_FILES
+    )
+
+
+def get_findings_view(
+    findings_format: FindingsFormat = "summary",
+    findings_offset: Annotated[int, Query(ge=0)] = 0,
+    findings_limit: Annotated[
+        int, Query(ge=1, le=settings.FINDINGS_MAX_LIMIT)
+    ] = settings.FINDINGS_DEFAULT_LIMIT,
+) -> dict[str, Any]:
+    return {
+        "findings_format": findings_format,
+        "findings_offset": findings_offset,
+        "findings_limit": findings_limit,
+    }
+
+
 def _map_exception(exc: Exception) -> HTTPException:
+    if isinstance(exc, UploadTooLargeError):
+        return HTTPException(status_code=413, detail=str(exc))
+    if isinstance(exc, UploadTimeoutError):
+        return HTTPException(status_code=408, detail=str(exc))
     if isinstance(exc, ValueError):
         return HTTPException(status_code=400, detail=str(exc))
     if isinstance(exc, RuntimeError):
@@ -27,43 +104,126 @@ def _map_exception(exc: Exception) -> HTTPException:
 async def check_document(
     payload: ComplianceRequest,
     service: Annotated[ComplianceApplicationService, Depends(get_service)],
+    deadline: Annotated[Deadline | None, Depends(get_deadline)],
+    findings_view: Annotated[dict[str, Any], Depends(get_findings_view)],
+    profiler: Annotated[RequestProfiler | None, Depends(get_profiler)],
 ):
     try:
-        report = await service.run_from_text(payload.document_text or "", payload.rules or {})
+        report = await service.run_from_text(
+            payload.document_text or "", payload.rules or {}, deadline, profiler
+        )
     except Exception as exc:
         raise _map_exception(exc) from exc
-    return JSONResponse(content=report.to_dict())
+    return ORJSONResponse(content=report.to_dict(**findings_view), headers=_profile_headers(profiler))
 
 
-@router.post("/check-file")
+@router.get("/llm-routes")
+async def llm_routes(
+    service: Annotated[ComplianceApplicationService, Depends(get_service)],
+) -> dict:
+    """
+    Per-route latency and token spend, for tuning the LLM routing thresholds.
+    """
+    client = service.llm_client
+    return client.stats() if isinstance(client, RoutingLLMClient) else {}
+
+
+@router.get("/index/search")
+async def search_index(
+    index: Annotated[DocumentIndexPort, Depends(get_index)],
+    q: Annotated[str, Query(min_length=1)],
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+) -> ORJSONResponse:
+    """
+    Term or phrase lookup across every indexed document.
+    """
+    return ORJSONResponse(content={"query": q, "results": await index.search(q, limit)})
+
+
+@router.post("/index/evaluate-rules")
+async def evaluate_rules(
+    payload: IndexRulesRequest,
+    index: Annotated[DocumentIndexPort, Depends(get_index)],
+) -> ORJSONResponse:
+    """
+    Evaluate a whole-word (``"match": "word"``) rule pack against already indexed documents.
+    """
+    try:
+        results = await index.evaluate_rules(payload.rules or {}, payload.limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return ORJSONResponse(content={"results": results})
+
+
+_CHECK_FILE_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {
+                        "file": {"type": "string", "format": "binary"},
+                        "forbidden_keywords": {"type": "string", "default": ""},
+                    },
+                }
+            }
+        },
+    }
+}
+
+
+@router.post("/check-file", openapi_extra=_CHECK_FILE_BODY)
 async def check_file(
+    request: Request,
     service: Annotated[ComplianceApplicationService, Depends(get_service)],
-    file: UploadFile = File(...),
-    forbidden_keywords: str = Form(""),
-) -> JSONResponse:
+    deadline: Annotated[Deadline | None, Depends(get_deadline)],
+    findings_view: Annotated[dict[str, Any], Depends(get_findings_view)],
+    profiler: Annotated[RequestProfiler | None, Depends(get_profiler)],
+) -> ORJSONResponse:
     """
     Multipart endpoint for uploading file. Returns full analysis.
+
+    The body is not parsed up front: ``AdmissionMiddleware`` admits the request first,
+    then it is streamed from the socket into the upload buffer.
     """
-    # save uploaded file to a temp file on server
-    suffix = os.path.splitext(file.filename)[1] or ""
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        content = await file.read()
-        tmp.write(content)
-        tmp_path = tmp.name
+    try:
+        # small uploads are parsed straight from memory; large ones spill to a temp file
+        with UploadBuffer("", settings.MAX_UPLOAD_BYTES, settings.UPLOAD_SPOOL_BYTES) as buffer:
+            upload = MultipartUploadReader(
+                request.headers.get("content-type", ""),
+                buffer,
+                max_field_bytes=settings.UPLOAD_MAX_FIELD_BYTES,
+            )
+            await upload.read(request.stream(), _upload_timeout(deadline))
 
-    # prepare rules
-    keywords = [k.strip() for k in forbidden_keywords.split(",") if k.strip()]
-    rules = {"forbidden_keywords": keywords}
+            # prepare rules
+            forbidden_keywords = upload.fields.get("forbidden_keywords", "")
+            keywords = [k.strip() for k in forbidden_keywords.split(",") if k.strip()]
+            rules = {"forbidden_keywords": keywords}
 
-    try:
-        report = await service.run_from_file(tmp_path, rules)
+            if buffer.in_memory:
+                report = await service.run_from_bytes(
+                    buffer.data, upload.filename or buffer.suffix, rules, deadline, profiler
+                )
+            else:
+                report = await service.run_from_file(
+                    buffer.path, rules, deadline, profiler, source_name=upload.filename
+                )
     except Exception as exc:
         raise _map_exception(exc) from exc
 
-    # cleanup temp file
-    try:
-        os.unlink(tmp_path)
-    except Exception:
-        pass
+    return ORJSONResponse(content=report.to_dict(**findings_view), headers=_profile_headers(profiler))
+
+
+def _upload_timeout(deadline: Deadline | None) -> float | None:
+    """Seconds the body may take to arrive: the read timeout, cut short by the deadline."""
+    limits = [deadline.remaining()] if deadline is not None else []
+    if settings.UPLOAD_READ_TIMEOUT_SECONDS > 0:
+        limits.append(settings.UPLOAD_READ_TIMEOUT_SECONDS)
+    return min(limits, default=None)
+
 
-    return JSONResponse(content=report.to_dict())
+def _profile_headers(profiler: RequestProfiler | None) -> dict[str, str] | None:
+    return {"X-Profile-Id": profiler.profile_id} if profiler is not None else None
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+# Lower values are admitted first.
+PRIORITY_TEXT = 0
+PRIORITY_SMALL_FILE = 1
+PRIORITY_LARGE_FILE = 2
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request cannot be admitted; carries a suggested retry delay in seconds."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(f"Compliance service is at capacity, retry in {retry_after}s")
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Caps in-flight pipeline runs and queues the overflow by priority.
+
+    Requests beyond ``max_in_flight`` wait in a bounded priority queue; once the queue
+    holds ``max_queue`` entries new arrivals are rejected immediately. A freed slot is
+    handed directly to the highest-priority (then oldest) waiter.
+    """
+
+    def __init__(self, max_in_flight: int, max_queue: int) -> None:
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self._in_flight = 0
+        self._waiters: list[list] = []
+        self._sequence = itertools.count()
+        self._avg_service_seconds = 1.0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    @asynccontextmanager
+    async def admit(self, priority: int = PRIORITY_TEXT, timeout: float | None = None) -> AsyncIterator[None]:
+        await self._acquire(priority, timeout)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - started
+            self._avg_service_seconds = 0.8 * self._avg_service_seconds + 0.2 * elapsed
+            self._release()
+
+    def retry_after(self) -> int:
+        backlog = (len(self._waiters) + 1) / max(1, self.max_in_flight)
+        return max(1, math.ceil(self._avg_service_seconds * backlog))
+
+    async def _acquire(self, priority: int, timeout: float | None) -> None:
+        if self._in_flight < self.max_in_flight and not self._waiters:
+            self._in_flight += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            raise AdmissionRejected(self.retry_after())
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        entry = [priority, next(self._sequence), future]
+        heapq.heappush(self._waiters, entry)
+        try:
+            await asyncio.wait_for(future, timeout)
+        except (TimeoutError, asyncio.CancelledError) as exc:
+            if future.done() and not future.cancelled():
+                # the slot was handed over just as we gave up; pass it on
+                self._release()
+            elif entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            if isinstance(exc, TimeoutError):
+                raise AdmissionRejected(self.retry_after()) from exc
+            raise
+
+    def _release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._in_flight -= 1
@@ -1,57 +1,303 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AbstractContextManager, asynccontextmanager, nullcontext
+from dataclasses import dataclass, field, replace
 from typing import Any
 
+from app.domain.models.deadline import Deadline
 from app.domain.models.document import Document
 from app.domain.models.compliance_report import ComplianceReport
 from app.domain.ports.cache import CachePort
 from app.domain.ports.file_loader import FileLoaderPort
-from app.domain.ports.llm import LLMClientPort
+from app.domain.ports.index import DocumentIndexPort
+from app.domain.ports.llm import LLMClientPort, LLMRequestContext
+from app.domain.ports.near_duplicates import NearDuplicate, NearDuplicateIndexPort
+from app.domain.ports.profiler import ProfilerPort, tracked
+from app.domain.services.cache_keys import (
+    content_hash,
+    rules_fingerprint,
+    sentiment_bucket,
+    stage_cache_key,
+)
 from app.domain.services.chunker import chunk_text
 from app.domain.services.rule_engine import run_rule_checks
 from app.domain.services.scoring import compute_compliance_score
 from app.domain.services.sentiment import get_sentiment
 
 
+logger = logging.getLogger(__name__)
+
+PIPELINE_STAGES = ("rules", "sentiment", "score", "summary", "recommendations")
+
+
+@dataclass(slots=True)
+class _PipelineRun:
+    """Per-request execution state threaded through the pipeline stages."""
+
+    deadline: Deadline | None = None
+    profiler: ProfilerPort | None = None
+    skipped: list[str] = field(default_factory=list)
+
+    def span(self, name: str) -> AbstractContextManager[None]:
+        return self.profiler.span(name) if self.profiler is not None else nullcontext()
+
+    @asynccontextmanager
+    async def profiling(self) -> AsyncIterator[None]:
+        if self.profiler is None:
+            yield
+            return
+        self.profiler.start()
+        try:
+            yield
+        finally:
+            await self.profiler.stop()
+
+
 @dataclass(slots=True)
 class ComplianceApplicationService:
     file_loader: FileLoaderPort
     llm_client: LLMClientPort
     cache: CachePort
+    index: DocumentIndexPort | None = None
+    near_duplicates: NearDuplicateIndexPort | None = None
 
-    async def run_from_text(self, document_text: str, rules: dict | None) -> ComplianceReport:
+    async def run_from_text(
+        self,
+        document_text: str,
+        rules: dict | None,
+        deadline: Deadline | None = None,
+        profiler: ProfilerPort | None = None,
+    ) -> ComplianceReport:
         document = Document(text=document_text.strip())
-        return await self._run_pipeline(document, rules or {})
+        run = _PipelineRun(deadline, profiler)
+        async with run.profiling():
+            return await self._run_pipeline(document, rules or {}, run)
+
+    async def run_from_file(
+        self,
+        path: str,
+        rules: dict | None,
+        deadline: Deadline | None = None,
+        profiler: ProfilerPort | None = None,
+        source_name: str | None = None,
+    ) -> ComplianceReport:
+        """Analyze a file on disk, recording ``source_name`` (e.g. an upload's name) instead."""
+        run = _PipelineRun(deadline, profiler)
+        async with run.profiling():
+            document = await self._within_budget(run, "load", lambda: self.file_loader.read(path))
+            if document is None:
+                return self._skipped_report(run)
+            if source_name is not None:
+                document.source_path = source_name
+            return await self._run_pipeline(document, rules or {}, run)
+
+    async def run_from_bytes(
+        self,
+        data: bytes | bytearray,
+        filename: str,
+        rules: dict | None,
+        deadline: Deadline | None = None,
+        profiler: ProfilerPort | None = None,
+    ) -> ComplianceReport:
+        run = _PipelineRun(deadline, profiler)
+        async with run.profiling():
+            document = await self._within_budget(
+                run, "load", lambda: self.file_loader.read_bytes(data, filename)
+            )
+            if document is None:
+                return self._skipped_report(run)
+            return await self._run_pipeline(document, rules or {}, run)
+
+    async def _run_pipeline(
+        self, document: Document, rules: dict, run: _PipelineRun
+    ) -> ComplianceReport:
+        text_hash = content_hash(document.text)
 
-    async def run_from_file(self, path: str, rules: dict | None) -> ComplianceReport:
-        text = await self.file_loader.read(path)
-        document = Document(text=text, source_path=path)
-        return await self._run_pipeline(document, rules or {})
+        rule_result = await self._run_stage(
+            run,
+            "rules",
+            stage_cache_key("rules", text=text_hash, rules=rules_fingerprint(rules)),
+            "result",
+            lambda: asyncio.to_thread(tracked(run_rule_checks), document.text, rules),
+        )
+        findings = rule_result.get("findings", []) if rule_result is not None else []
+
+        sentiment = await self._run_stage(
+            run,
+            "sentiment",
+            stage_cache_key("sentiment", text=text_hash),
+            "sentiment",
+            lambda: asyncio.to_thread(tracked(get_sentiment), document.text),
+        )
 
-    async def _run_pipeline(self, document: Document, rules: dict) -> ComplianceReport:
-        rule_result = run_rule_checks(document.text, rules)
-        findings = rule_result.get("findings", [])
+        # the score is only meaningful when every input to it completed
+        score: int | None = None
+        risk: str | None = None
+        if rule_result is not None and sentiment is not None:
+            score = compute_compliance_score(findings, sentiment)
+            risk = "LOW" if score >= 80 else "MEDIUM" if score >= 50 else "HIGH"
+        else:
+            run.skipped.append("score")
 
-        sentiment = get_sentiment(document.text)
-        score = compute_compliance_score(findings, sentiment)
+        # near-duplicates of an analyzed document reuse its LLM outputs instead of regenerating
+        near: NearDuplicate | None = None
+        signature: tuple[int, ...] = ()
+        if self.near_duplicates is not None and document.text:
+            lookup = await self._within_budget(
+                run, "near_duplicate", lambda: self._find_near_duplicate(document.text)
+            )
+            if lookup is not None:
+                signature, near = lookup
+        matches = self._finding_matches(findings)
+        bucket = sentiment_bucket(sentiment or {})
+        reused: list[str] = []
 
+        summary_context = LLMRequestContext(
+            stage="summary",
+            document_chars=len(document.text),
+            findings=len(findings),
+            risk_level=risk or "UNKNOWN",
+        )
         prompt = self._build_summary_prompt(document.text)
-        summary = await self._generate_with_cache(prompt)
+        if near is not None:
+            summary = near.payload["summary"]
+            reused.append("summary")
+        else:
+            summary = await self._run_stage(
+                run,
+                "summary",
+                stage_cache_key(
+                    "summary",
+                    prompt=content_hash(prompt),
+                    model=self.llm_client.model_name(summary_context),
+                ),
+                "summary",
+                lambda: self.llm_client.generate(prompt, summary_context),
+            )
 
-        recommendations = await self._generate_recommendations(summary, findings, sentiment)
+        recommendations = None
+        if summary is None:
+            run.skipped.append("recommendations")
+        elif (
+            near is not None
+            and rule_result is not None
+            and near.payload["matches"] == matches
+            and near.payload.get("sentiment") == bucket
+        ):
+            # recommendations are prompted with the findings and sentiment bucket, so they
+            # are only reused when both agree
+            recommendations = near.payload["recommendations"]
+            reused.append("recommendations")
+        else:
+            rec_context = replace(summary_context, stage="recommendations")
+            rec_key, rec_prompt = self._recommendations_request(
+                summary, findings, sentiment or {}, rec_context
+            )
+            recommendations = await self._run_stage(
+                run,
+                "recommendations",
+                rec_key,
+                "recommendations",
+                lambda: self.llm_client.generate(rec_prompt, rec_context),
+            )
 
-        tokens = self._estimate_tokens(prompt, summary)
-        risk = "LOW" if score >= 80 else "MEDIUM" if score >= 50 else "HIGH"
+        if "summary" in reused:
+            tokens = self._estimate_tokens("", "")
+        else:
+            tokens = self._estimate_tokens(prompt, summary or "")
+
+        if (
+            signature
+            and near is None
+            and rule_result is not None
+            and sentiment is not None
+            and summary is not None
+            and recommendations is not None
+        ):
+            await self.near_duplicates.add(
+                text_hash,
+                signature,
+                {
+                    "summary": summary,
+                    "recommendations": recommendations,
+                    "matches": matches,
+                    "sentiment": bucket,
+                },
+            )
+
+        if self.index is not None and document.text:
+            # the index is a side product; a busy or broken index must not fail the analysis
+            with run.span("index"):
+                try:
+                    await self.index.add(text_hash, document.text, document.source_path)
+                except Exception:
+                    logger.warning("Indexing document %s failed", text_hash, exc_info=True)
 
         return ComplianceReport(
-            summary=summary,
+            summary=summary or "",
             sentiment=sentiment,
             findings=findings,
             score=score,
-            recommendations=recommendations,
+            recommendations=recommendations or "",
             tokens=tokens,
             risk_level=risk,
+            skipped_stages=run.skipped,
+            ocr_skipped_pages=document.ocr_skipped_pages,
+            reused_from=(
+                {"document": near.document_id, "similarity": round(near.similarity, 4), "stages": reused}
+                if near is not None
+                else None
+            ),
+        )
+
+    async def _run_stage(
+        self,
+        run: _PipelineRun,
+        name: str,
+        key: str,
+        field: str,
+        compute: Callable[[], Any],
+    ) -> Any | None:
+        return await self._within_budget(run, name, lambda: self._cached_stage(key, field, compute))
+
+    async def _within_budget(
+        self, run: _PipelineRun, name: str, compute: Callable[[], Awaitable[Any]]
+    ) -> Any | None:
+        """Await a stage, cancelling it and recording it as skipped if the deadline passes."""
+        with run.span(name):
+            if run.deadline is None:
+                return await compute()
+            if run.deadline.expired:
+                run.skipped.append(name)
+                return None
+            try:
+                # a timeout scope rather than wait_for keeps the stage on the request's own
+                # task, which is what the profiler attributes event-loop samples to
+                async with asyncio.timeout(run.deadline.remaining()):
+                    return await compute()
+            except TimeoutError:
+                run.skipped.append(name)
+                return None
+
+    async def _find_near_duplicate(
+        self, text: str
+    ) -> tuple[tuple[int, ...], NearDuplicate | None]:
+        signature = await self.near_duplicates.signature(text)
+        return signature, await self.near_duplicates.find(signature)
+
+    def _skipped_report(self, run: _PipelineRun) -> ComplianceReport:
+        return ComplianceReport(
+            summary="",
+            sentiment=None,
+            findings=[],
+            score=None,
+            recommendations="",
+            tokens=self._estimate_tokens("", ""),
+            risk_level=None,
+            skipped_stages=[*run.skipped, *PIPELINE_STAGES],
         )
 
     def _build_summary_prompt(self, text: str) -> str:
@@ -61,27 +307,45 @@ class ComplianceApplicationService:
             summary_source = text[:2000]
         return f"Summarize:\n{summary_source}"
 
-    async def _generate_with_cache(self, prompt: str) -> str:
-        cached = await self.cache.get(prompt)
-        if cached and cached.get("summary"):
-            return cached["summary"]
+    async def _cached_stage(self, key: str, field: str, compute: Callable[[], Any]) -> Any:
+        cached = await self.cache.get(key)
+        if cached and field in cached:
+            return cached[field]
 
-        summary = await self.llm_client.generate(prompt)
-        await self.cache.set(prompt, {"summary": summary})
-        return summary
+        value = compute()
+        if isinstance(value, Awaitable):
+            value = await value
+        await self.cache.set(key, {field: value})
+        return value
 
-    async def _generate_recommendations(
+    def _recommendations_request(
         self,
         summary: str,
         findings: list[dict[str, Any]],
         sentiment: dict[str, Any],
-    ) -> str:
+        context: LLMRequestContext,
+    ) -> tuple[str, str]:
+        # Only canonical inputs go into the prompt so that the key fully determines the output.
+        matches = self._finding_matches(findings)
+        bucket = sentiment_bucket(sentiment)
+        key = stage_cache_key(
+            "recommendations",
+            summary=content_hash(summary),
+            findings=matches,
+            sentiment=bucket,
+            model=self.llm_client.model_name(context),
+        )
+        findings_block = "\n".join(f"- {match}" for match in matches) or "None"
         rec_prompt = (
             "Summary:\n"
-            f"{summary}\n\nFindings:\n{findings}\n\nSentiment:\n{sentiment}\n\n"
+            f"{summary}\n\nFindings:\n{findings_block}\n\nSentiment:\n{bucket}\n\n"
             "Provide 3 compliance recommendations."
         )
-        return await self.llm_client.generate(rec_prompt)
+        return key, rec_prompt
+
+    @staticmethod
+    def _finding_matches(findings: list[dict[str, Any]]) -> list[str]:
+        return [str(finding.get("match", "")) for finding in findings]
 
     def _estimate_tokens(self, prompt: str, summary: str) -> dict[str, int]:
         input_tokens = len(prompt.split())
@@ -0,0 +1,214 @@
+"""Scan a directory tree of PDF/DOCX files through the compliance pipeline.
+
+Results are appended to a JSONL file, one line per document. The SHA-256 of every
+successfully analyzed file is appended to a checkpoint file, so an interrupted run
+resumes where it left off (failed files are retried).
+
+    python -m app.cli.scan_corpus ./archive --output results.jsonl --keywords secret,confidential
+
+Each worker process is itself the parallelism for its document: PDF parsing and OCR run
+inline in the worker instead of in nested process pools. With ``INDEX_ENABLED`` every
+worker also writes to the same SQLite index; SQLite serializes those writes, so pass
+``--no-index`` for large scans where the index is not needed.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any
+
+from app.domain.models.findings import FINDINGS_FORMATS
+
+SUPPORTED_SUFFIXES = {".pdf", ".docx"}
+HASH_CHUNK_BYTES = 1024 * 1024
+
+# one event loop per worker process, kept for the worker's lifetime: the service and its
+# LLM client are cached per process, and their connection pools stay bound to the loop
+# they were first used on
+_runner: asyncio.Runner | None = None
+
+
+def iter_documents(root: Path) -> Iterator[Path]:
+    for directory, subdirectories, filenames in os.walk(root):
+        subdirectories.sort()
+        for filename in sorted(filenames):
+            if Path(filename).suffix.lower() in SUPPORTED_SUFFIXES:
+                yield Path(directory) / filename
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_checkpoint(path: Path) -> set[str]:
+    if not path.exists():
+        return set()
+    with path.open(encoding="utf-8") as handle:
+        return {line.strip() for line in handle if line.strip()}
+
+
+def init_worker(index_enabled: bool) -> None:
+    """Worker initializer: size this process's service for running inside a pool."""
+    from app.core.config import settings
+
+    # the scan pool already uses every core, so per-worker PDF/OCR pools would oversubscribe
+    settings.PDF_WORKERS = 0
+    settings.OCR_WORKERS = 0
+    settings.INDEX_ENABLED = settings.INDEX_ENABLED and index_enabled
+    _worker_runner()
+
+
+def _worker_runner() -> asyncio.Runner:
+    global _runner
+    if _runner is None:
+        _runner = asyncio.Runner()
+    return _runner
+
+
+def analyze_file(path: str, rules: dict, findings_format: str) -> dict[str, Any]:
+    """Worker entry point: run the pipeline for one file in this process's service."""
+    from app.infrastructure.container import get_compliance_service
+
+    try:
+        report = _worker_runner().run(get_compliance_service().run_from_file(path, rules))
+    except Exception as exc:
+        return {"status": "error", "error": f"{type(exc).__name__}: {exc}"}
+    return {"status": "ok", "report": report.to_dict(findings_format)}
+
+
+class Progress:
+    def __init__(self, interval: float = 2.0) -> None:
+        self.interval = interval
+        self.started = time.monotonic()
+        self.last_report = 0.0
+        self.completed = 0
+        self.failed = 0
+        self.skipped = 0
+
+    def report(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self.last_report < self.interval:
+            return
+        self.last_report = now
+        elapsed = max(now - self.started, 1e-9)
+        print(
+            f"[scan] done={self.completed} failed={self.failed} skipped={self.skipped} "
+            f"rate={self.completed / elapsed:.2f} docs/s elapsed={elapsed:.0f}s",
+            file=sys.stderr,
+            flush=True,
+        )
+
+
+def scan(
+    root: Path,
+    output: Path,
+    checkpoint: Path,
+    rules: dict,
+    workers: int,
+    findings_format: str = "summary",
+    index_enabled: bool = True,
+) -> Progress:
+    done = load_checkpoint(checkpoint)
+    progress = Progress()
+    max_pending = workers * 2
+    pending: dict[Future, tuple[Path, str]] = {}
+    seen: set[str] = set()
+
+    with (
+        output.open("a", encoding="utf-8") as results,
+        checkpoint.open("a", encoding="utf-8") as completed,
+        ProcessPoolExecutor(
+            max_workers=workers, initializer=init_worker, initargs=(index_enabled,)
+        ) as pool,
+    ):
+
+        def drain(block_until: int) -> None:
+            while len(pending) > block_until:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    path, digest = pending.pop(future)
+                    try:
+                        outcome = future.result()
+                    except Exception as exc:
+                        outcome = {"status": "error", "error": f"{type(exc).__name__}: {exc}"}
+                    record = {"path": str(path), "sha256": digest, **outcome}
+                    results.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    results.flush()
+                    if outcome["status"] == "ok":
+                        # checkpoint only after the result line is durable
+                        completed.write(digest + "\n")
+                        completed.flush()
+                        progress.completed += 1
+                    else:
+                        progress.failed += 1
+                progress.report()
+
+        try:
+            for path in iter_documents(root):
+                try:
+                    digest = file_sha256(path)
+                except OSError as exc:
+                    print(f"[scan] cannot read {path}: {exc}", file=sys.stderr)
+                    progress.failed += 1
+                    continue
+                if digest in done or digest in seen:
+                    progress.skipped += 1
+                    continue
+                seen.add(digest)
+                future = pool.submit(analyze_file, str(path), rules, findings_format)
+                pending[future] = (path, digest)
+                drain(max_pending - 1)
+            drain(0)
+        except KeyboardInterrupt:
+            pool.shutdown(wait=False, cancel_futures=True)
+            print("[scan] interrupted; rerun the same command to resume", file=sys.stderr)
+
+    progress.report(force=True)
+    return progress
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the compliance pipeline over a directory of PDF/DOCX files.")
+    parser.add_argument("root", type=Path, help="directory to scan recursively")
+    parser.add_argument("--output", type=Path, default=Path("scan_results.jsonl"))
+    parser.add_argument("--checkpoint", type=Path, help="defaults to <output>.checkpoint")
+    parser.add_argument("--keywords", default="", help="comma separated forbidden keywords")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--findings-format", choices=FINDINGS_FORMATS, default="summary")
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help="do not add documents to the INDEX_PATH index even when INDEX_ENABLED is set",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.root.is_dir():
+        parser.error(f"not a directory: {args.root}")
+
+    checkpoint = args.checkpoint or args.output.with_name(args.output.name + ".checkpoint")
+    keywords = [k.strip() for k in args.keywords.split(",") if k.strip()]
+    progress = scan(
+        args.root,
+        args.output,
+        checkpoint,
+        {"forbidden_keywords": keywords},
+        max(1, args.workers),
+        args.findings_format,
+        index_enabled=not args.no_index,
+    )
+    return 1 if progress.failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -12,12 +12,70 @@ class Settings(BaseSettings):
     # Redis cache
     redis_url: str = "redis://localhost:6379/0"
 
+    # In-process stage cache (least recently used entries are evicted beyond this)
+    CACHE_MAX_ENTRIES: int = 10000
+
     # Chunking config
     MAX_TOKENS_PER_CHUNK: int = 500
     MIN_CHUNK_LENGTH: int = 50
 
+    # Request deadlines (0 disables); X-Request-Budget-Ms may only shorten this
+    REQUEST_BUDGET_MS: int = 30000
+
+    # Admission control for the compliance endpoints
+    ADMISSION_MAX_IN_FLIGHT: int = 4
+    ADMISSION_MAX_QUEUE: int = 32
+    ADMISSION_LARGE_UPLOAD_BYTES: int = 2 * 1024 * 1024
+
+    # Upload handling
+    MAX_UPLOAD_BYTES: int = 25 * 1024 * 1024
+    UPLOAD_MAX_FIELD_BYTES: int = 64 * 1024  # non-file form fields, e.g. forbidden_keywords
+    UPLOAD_SPOOL_BYTES: int = 8 * 1024 * 1024  # larger uploads are spilled to a temp file
+    UPLOAD_READ_TIMEOUT_SECONDS: float = 60.0  # 0 disables; the request deadline also applies
+
+    # Findings paging on the check endpoints (occurrences per page, or rules in summary mode)
+    FINDINGS_DEFAULT_LIMIT: int = 1000
+    FINDINGS_MAX_LIMIT: int = 10000
+
+    # PDF parsing (PyMuPDF is not thread-safe, so documents are parsed in worker processes)
+    PDF_WORKERS: int = 4  # 0 parses inline on a thread instead of a process pool
+
+    # OCR fallback for scanned PDFs
+    OCR_ENABLED: bool = True
+    OCR_DPI: int = 200
+    OCR_LANGUAGE: str = "eng"
+    OCR_WORKERS: int = 4  # 0 runs OCR inline on a thread instead of a process pool
+    OCR_MAX_PAGES_PER_DOCUMENT: int = 50
+    OCR_MAX_CONCURRENT_PAGES: int = 2  # per document, below OCR_WORKERS so one scan leaves room
+
+    # Per-request profiling (X-Profile header, or a sampled fraction of requests)
+    PROFILE_TOKEN: str = ""  # X-Profile must carry this value; empty ignores the header
+    PROFILE_SAMPLE_RATE: float = 0.0
+    PROFILE_INTERVAL_MS: float = 5.0
+    PROFILE_OUTPUT_DIR: str = "profiles"
+    PROFILE_MAX_FILES: int = 100  # profiles kept in PROFILE_OUTPUT_DIR, oldest deleted first
+
+    # Near-duplicate reuse of summaries/recommendations (MinHash + LSH)
+    NEAR_DUP_ENABLED: bool = True
+    NEAR_DUP_THRESHOLD: float = 0.9
+    NEAR_DUP_NUM_PERM: int = 128
+    NEAR_DUP_BANDS: int = 32
+    NEAR_DUP_SHINGLE_SIZE: int = 5
+    NEAR_DUP_MAX_ENTRIES: int = 10000
+
+    # Inverted index over analyzed documents
+    INDEX_ENABLED: bool = False
+    INDEX_PATH: str = "data/compliance_index.sqlite3"
+
     # LLM model
     LLM_MODEL: str = "gpt-4o-mini"
+    LLM_TIMEOUT_SECONDS: float = 60.0
+
+    # LLM routing: the remote model is used only when a request crosses one of these thresholds
+    LLM_ROUTING_ENABLED: bool = True
+    LLM_REMOTE_MIN_CHARS: int = 2000
+    LLM_REMOTE_MIN_FINDINGS: int = 1
+    LLM_REMOTE_RISK_LEVELS: str = "MEDIUM,HIGH"
 
     class Config:
         env_file = ".env"
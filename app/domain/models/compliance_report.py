@@ -1,25 +1,76 @@
 from dataclasses import dataclass, field
 from typing import Any
 
+from app.domain.models.findings import (
+    FINDINGS_FORMATS,
+    CompactFindings,
+    count_occurrences,
+    page_findings,
+    summarize_findings,
+)
+
 
 @dataclass(slots=True)
 class ComplianceReport:
     summary: str
-    sentiment: dict[str, Any]
+    sentiment: dict[str, Any] | None
     findings: list[dict[str, Any]]
-    score: int
+    score: int | None
     recommendations: str
     tokens: dict[str, int]
-    risk_level: str
+    risk_level: str | None
+    skipped_stages: list[str] = field(default_factory=list)
+    ocr_skipped_pages: list[int] = field(default_factory=list)
+    reused_from: dict[str, Any] | None = None
+
+    @property
+    def partial(self) -> bool:
+        return bool(self.skipped_stages or self.ocr_skipped_pages)
+
+    def to_dict(
+        self,
+        findings_format: str = "full",
+        findings_offset: int = 0,
+        findings_limit: int | None = None,
+    ) -> dict[str, Any]:
+        """Serialize the report.
+
+        ``findings_format`` selects ``full`` (dicts per rule, with offsets), ``compact``
+        (columnar occurrences, see ``CompactFindings``) or ``summary`` (occurrence counts
+        only). Offset and limit page over occurrences in ``full`` and ``compact`` mode, and
+        over rules in ``summary`` mode.
+        """
+        if findings_format not in FINDINGS_FORMATS:
+            raise ValueError(f"Unknown findings format: {findings_format}")
+
+        if findings_format == "compact":
+            compact = CompactFindings.from_findings(self.findings)
+            total = compact.total
+            findings: Any = compact.page(findings_offset, findings_limit).to_dict()
+        elif findings_format == "summary":
+            end = None if findings_limit is None else findings_offset + findings_limit
+            total = len(self.findings)
+            findings = summarize_findings(self.findings[findings_offset:end])
+        else:
+            total = count_occurrences(self.findings)
+            findings = page_findings(self.findings, findings_offset, findings_limit)
 
-    def to_dict(self) -> dict[str, Any]:
         return {
-            "status": "ok",
+            "status": "partial" if self.partial else "ok",
             "summary": self.summary,
             "sentiment": self.sentiment,
-            "findings": self.findings,
+            "findings": findings,
+            "findings_page": {
+                "format": findings_format,
+                "offset": findings_offset,
+                "limit": findings_limit,
+                "total": total,
+            },
             "score": self.score,
             "recommendations": self.recommendations,
             "tokens": self.tokens,
             "risk_level": self.risk_level,
+            "skipped_stages": self.skipped_stages,
+            "ocr_skipped_pages": self.ocr_skipped_pages,
+            "reused_from": self.reused_from,
         }
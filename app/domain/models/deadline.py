@@ -0,0 +1,20 @@
+import time
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class Deadline:
+    """A point in monotonic time by which a request must finish."""
+
+    expires_at: float
+
+    @classmethod
+    def after_ms(cls, budget_ms: int) -> "Deadline":
+        return cls(expires_at=time.monotonic() + budget_ms / 1000)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
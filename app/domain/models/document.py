@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass(slots=True)
@@ -7,3 +7,5 @@ class Document:
 
     text: str
     source_path: str | None = None
+    # 1-based numbers of image-only pages left un-OCR'd because of the per-document budget
+    ocr_skipped_pages: list[int] = field(default_factory=list)
@@ -0,0 +1,97 @@
+from dataclasses import dataclass, field
+from typing import Any, Literal, get_args
+
+FindingsFormat = Literal["full", "compact", "summary"]
+FINDINGS_FORMATS: tuple[str, ...] = get_args(FindingsFormat)
+
+
+@dataclass(slots=True)
+class CompactFindings:
+    """Columnar view of per-occurrence findings.
+
+    Rule names are stored once in ``rules``; ``rule_ids[i]``, ``offsets[i]`` and
+    ``lengths[i]`` describe the i-th occurrence.
+    """
+
+    rules: list[str] = field(default_factory=list)
+    rule_ids: list[int] = field(default_factory=list)
+    offsets: list[int] = field(default_factory=list)
+    lengths: list[int] = field(default_factory=list)
+
+    @classmethod
+    def from_findings(cls, findings: list[dict[str, Any]]) -> "CompactFindings":
+        compact = cls()
+        interned: dict[str, int] = {}
+        for finding in findings:
+            name = str(finding.get("match", ""))
+            rule_id = interned.setdefault(name, len(compact.rules))
+            if rule_id == len(compact.rules):
+                compact.rules.append(name)
+            occurrences = finding.get("offsets") or []
+            compact.rule_ids.extend([rule_id] * len(occurrences))
+            compact.offsets.extend(occurrences)
+            # the matched span, which may differ from the keyword (case folding, separators)
+            ends = finding.get("ends") or []
+            compact.lengths.extend(end - start for start, end in zip(occurrences, ends))
+        return compact
+
+    @property
+    def total(self) -> int:
+        return len(self.offsets)
+
+    def page(self, offset: int = 0, limit: int | None = None) -> "CompactFindings":
+        end = None if limit is None else offset + limit
+        return CompactFindings(
+            rules=self.rules,
+            rule_ids=self.rule_ids[offset:end],
+            offsets=self.offsets[offset:end],
+            lengths=self.lengths[offset:end],
+        )
+
+    def to_dict(self) -> dict[str, list]:
+        return {
+            "rules": self.rules,
+            "rule_id": self.rule_ids,
+            "offset": self.offsets,
+            "length": self.lengths,
+        }
+
+
+def summarize_findings(findings: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [
+        {"match": finding.get("match"), "count": len(finding.get("offsets") or [])}
+        for finding in findings
+    ]
+
+
+def count_occurrences(findings: list[dict[str, Any]]) -> int:
+    return sum(len(finding.get("offsets") or []) for finding in findings)
+
+
+def page_findings(
+    findings: list[dict[str, Any]], offset: int = 0, limit: int | None = None
+) -> list[dict[str, Any]]:
+    """Slice per-rule findings by occurrence, keeping each page grouped by rule.
+
+    Rules with no occurrence inside the page are left out, so the page size is bounded by
+    ``limit`` however many times a single keyword matches.
+    """
+    end = None if limit is None else offset + limit
+    page: list[dict[str, Any]] = []
+    position = 0
+    for finding in findings:
+        if end is not None and position >= end:
+            break
+        occurrences = finding.get("offsets") or []
+        start = max(offset - position, 0)
+        stop = len(occurrences) if end is None else min(end - position, len(occurrences))
+        if start < stop:
+            page.append(
+                {
+                    **finding,
+                    "offsets": occurrences[start:stop],
+                    "ends": (finding.get("ends") or [])[start:stop],
+                }
+            )
+        position += len(occurrences)
+    return page
@@ -1,6 +1,11 @@
 from typing import Protocol
 
+from app.domain.models.document import Document
+
 
 class FileLoaderPort(Protocol):
-    async def read(self, path: str) -> str:
+    async def read(self, path: str) -> Document:
+        ...
+
+    async def read_bytes(self, data: bytes | bytearray, filename: str) -> Document:
         ...
@@ -0,0 +1,12 @@
+from typing import Any, Protocol
+
+
+class DocumentIndexPort(Protocol):
+    async def add(self, document_id: str, text: str, source: str | None = None) -> None:
+        ...
+
+    async def search(self, query: str, limit: int = 100) -> list[dict[str, Any]]:
+        ...
+
+    async def evaluate_rules(self, rules: dict, limit: int = 100) -> dict[str, list[dict[str, Any]]]:
+        ...
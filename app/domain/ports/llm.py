@@ -1,6 +1,20 @@
+from dataclasses import dataclass
 from typing import Protocol
 
 
+@dataclass(slots=True, frozen=True)
+class LLMRequestContext:
+    """Signals about the request an LLM call belongs to, used for backend routing."""
+
+    stage: str
+    document_chars: int = 0
+    findings: int = 0
+    risk_level: str = "LOW"
+
+
 class LLMClientPort(Protocol):
-    async def generate(self, prompt: str) -> str:
+    async def generate(self, prompt: str, context: LLMRequestContext | None = None) -> str:
+        ...
+
+    def model_name(self, context: LLMRequestContext | None = None) -> str:
         ...
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+
+@dataclass(slots=True, frozen=True)
+class NearDuplicate:
+    """A previously analyzed document similar enough to reuse its LLM outputs."""
+
+    document_id: str
+    similarity: float
+    payload: dict[str, Any]
+
+
+class NearDuplicateIndexPort(Protocol):
+    async def signature(self, text: str) -> tuple[int, ...]:
+        ...
+
+    async def find(self, signature: tuple[int, ...]) -> NearDuplicate | None:
+        ...
+
+    async def add(self, document_id: str, signature: tuple[int, ...], payload: dict[str, Any]) -> None:
+        ...
@@ -0,0 +1,44 @@
+import functools
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from contextvars import ContextVar
+from typing import Protocol, TypeVar
+
+T = TypeVar("T")
+
+
+class ProfilerPort(Protocol):
+    def start(self) -> None:
+        ...
+
+    async def stop(self) -> None:
+        ...
+
+    def span(self, name: str) -> AbstractContextManager[None]:
+        ...
+
+    def track_thread(self) -> AbstractContextManager[None]:
+        """Include the calling worker thread in the profile until the context exits."""
+        ...
+
+
+# set by a profiler's ``start`` for the duration of the profiled run
+active_profiler: ContextVar[ProfilerPort | None] = ContextVar("active_profiler", default=None)
+
+
+def tracked(func: Callable[..., T]) -> Callable[..., T]:
+    """Wrap ``func`` so the thread that runs it is sampled by the caller's active profiler.
+
+    Work handed to threads uses this; the profiler is looked up when wrapping, in the
+    request's context, so it also works with ``run_in_executor``.
+    """
+    profiler = active_profiler.get()
+    if profiler is None:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> T:
+        with profiler.track_thread():
+            return func(*args, **kwargs)
+
+    return wrapper
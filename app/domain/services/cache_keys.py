@@ -0,0 +1,28 @@
+import hashlib
+import json
+from typing import Any
+
+# Bump whenever the shape of a cached stage payload changes so stale entries are ignored.
+CACHE_KEY_VERSION = 4
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def canonical_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def rules_fingerprint(rules: dict) -> str:
+    return content_hash(canonical_json(rules))[:16]
+
+
+def sentiment_bucket(sentiment: dict[str, Any]) -> str:
+    return str(sentiment.get("sentiment") or "Neutral").lower()
+
+
+def stage_cache_key(stage: str, **params: Any) -> str:
+    """Build a deterministic key for a pipeline stage from its content hash and parameters."""
+    digest = content_hash(canonical_json(params))
+    return f"{stage}:v{CACHE_KEY_VERSION}:{digest}"
@@ -0,0 +1,53 @@
+import hashlib
+
+from app.domain.services.tokenizer import iter_terms
+
+_MAX_HASH = (1 << 64) - 1
+
+
+def _shingle_hashes(text: str, shingle_size: int) -> set[int]:
+    words = [term for term, _, _ in iter_terms(text)]
+    if not words:
+        return set()
+    if len(words) <= shingle_size:
+        shingles = [" ".join(words)]
+    else:
+        shingles = (" ".join(words[i : i + shingle_size]) for i in range(len(words) - shingle_size + 1))
+    return {
+        int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for shingle in shingles
+    }
+
+
+def minhash_signature(text: str, num_perm: int = 128, shingle_size: int = 5) -> tuple[int, ...]:
+    """MinHash signature over word shingles of the normalized text.
+
+    Uses one-permutation hashing: each shingle hash is routed to one of ``num_perm`` bins
+    and each bin keeps its minimum, so the cost is a single pass over the shingles.
+    Empty bins borrow from the next non-empty bin (rotation densification) so that
+    signatures of short documents remain comparable. Returns ``()`` for empty text.
+    """
+    bins = [_MAX_HASH] * num_perm
+    for value in _shingle_hashes(text, shingle_size):
+        index = value % num_perm
+        reduced = value // num_perm
+        if reduced < bins[index]:
+            bins[index] = reduced
+    if all(value == _MAX_HASH for value in bins):
+        return ()
+
+    signature = list(bins)
+    for index, value in enumerate(bins):
+        if value != _MAX_HASH:
+            continue
+        distance = 1
+        while bins[(index + distance) % num_perm] == _MAX_HASH:
+            distance += 1
+        signature[index] = bins[(index + distance) % num_perm] + distance * (_MAX_HASH // num_perm + 1)
+    return tuple(signature)
+
+
+def estimate_jaccard(left: tuple[int, ...], right: tuple[int, ...]) -> float:
+    if not left or len(left) != len(right):
+        return 0.0
+    return sum(a == b for a, b in zip(left, right)) / len(left)
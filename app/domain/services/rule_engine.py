@@ -1,13 +1,54 @@
+import re
 from collections.abc import Iterable
 
+from app.domain.services.tokenizer import TERM_PATTERN
+
+# ``rules["match"]``: "substring" flags a keyword anywhere (so "password" also flags
+# "passwords"); "word" only flags whole words and word sequences, as the corpus index does
+RULE_MATCH_MODES = ("substring", "word")
+
+
+def rule_match_mode(rules: dict) -> str:
+    mode = rules.get("match") or "substring"
+    if mode not in RULE_MATCH_MODES:
+        expected = ", ".join(RULE_MATCH_MODES)
+        raise ValueError(f"Unknown rule match mode {mode!r}; expected one of {expected}")
+    return mode
+
 
 def run_rule_checks(text: str, rules: dict) -> dict:
-    findings: list[dict[str, str]] = []
+    """Flag each forbidden keyword wherever it occurs, ignoring case.
+
+    Matching runs on the original text, so ``offsets``/``ends`` index into it directly.
+    In "word" mode keywords are split into words the way ``iter_terms`` tokenizes the
+    corpus index, so a live check and ``evaluate_rules`` over indexed documents agree.
+    """
+    findings: list[dict] = []
     keywords: Iterable[str] = rules.get("forbidden_keywords", []) or []
-    lowered = text.lower()
+    whole_words = rule_match_mode(rules) == "word"
 
     for keyword in keywords:
-        if keyword and keyword.lower() in lowered:
-            findings.append({"match": keyword})
+        pattern = _keyword_pattern(keyword or "", whole_words)
+        if pattern is None:
+            continue
+        spans = [match.span() for match in pattern.finditer(text)]
+        if spans:
+            findings.append(
+                {
+                    "match": keyword,
+                    "offsets": [start for start, _ in spans],
+                    "ends": [end for _, end in spans],
+                }
+            )
 
     return {"failed": bool(findings), "findings": findings}
+
+
+def _keyword_pattern(keyword: str, whole_words: bool) -> re.Pattern[str] | None:
+    if not whole_words:
+        return re.compile(re.escape(keyword), re.IGNORECASE) if keyword else None
+    words = TERM_PATTERN.findall(keyword)
+    if not words:
+        return None
+    phrase = r"\W+".join(re.escape(word) for word in words)
+    return re.compile(rf"(?<!\w){phrase}(?!\w)", re.IGNORECASE)
@@ -1,2 +1,19 @@
+import re
+from collections.abc import Iterator
+
+
 def count_tokens(text: str) -> int:
     return max(1, len(text) // 4)
+
+
+TERM_PATTERN = re.compile(r"\w+")
+
+
+def iter_terms(text: str) -> Iterator[tuple[str, int, int]]:
+    """Yield ``(term, position, offset)`` for each normalized word in ``text``.
+
+    Words are lowercased one at a time, so ``offset`` indexes into ``text`` itself even
+    where lowercasing changes a string's length (e.g. "İ").
+    """
+    for position, match in enumerate(TERM_PATTERN.finditer(text)):
+        yield match.group().lower(), position, match.start()
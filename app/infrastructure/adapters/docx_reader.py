@@ -0,0 +1,123 @@
+import zipfile
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import IO
+from xml.etree.ElementTree import Element, iterparse
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_P = f"{_W}p"
+_R = f"{_W}r"
+_T = f"{_W}t"
+_TAB = f"{_W}tab"
+_BR = f"{_W}br"
+_CR = f"{_W}cr"
+_TC = f"{_W}tc"
+_VMERGE = f"{_W}vMerge"
+_HMERGE = f"{_W}hMerge"
+_VAL = f"{_W}val"
+_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+_RUN_BREAKS = {_TAB: "\t", _BR: "\n", _CR: "\n"}
+
+
+@dataclass(slots=True)
+class DocxBlock:
+    """A paragraph or table cell, with its offset in the newline-joined document text."""
+
+    kind: str
+    text: str
+    offset: int
+
+
+@dataclass(slots=True)
+class _Container:
+    """An open paragraph or table cell.
+
+    ``parts`` holds a paragraph's run text or a cell's finished paragraphs. ``deferred``
+    holds text-box content finished inside a paragraph, emitted after the paragraph.
+    """
+
+    kind: str
+    parts: list[str] = field(default_factory=list)
+    deferred: list[str] = field(default_factory=list)
+    merged: bool = False
+
+
+def iter_docx_blocks(source: str | IO[bytes]) -> Iterator[DocxBlock]:
+    """Stream paragraphs and table cells out of ``word/document.xml`` in document order.
+
+    The XML is parsed incrementally and every element is dropped once consumed, so memory
+    stays flat regardless of document length. Continuation cells of vertically or
+    (legacy) horizontally merged ranges are skipped so merged text is emitted once.
+    Text boxes are read from their ``mc:Choice`` markup only (the ``mc:Fallback`` copy is
+    skipped) and emitted after the paragraph that anchors them.
+    """
+    with zipfile.ZipFile(source) as archive, archive.open("word/document.xml") as xml:
+        yield from _iter_blocks(xml)
+
+
+def _iter_blocks(xml: IO[bytes]) -> Iterator[DocxBlock]:
+    offset = 0
+    stack: list[Element] = []
+    containers: list[_Container] = []
+    skip_depth: int | None = None
+
+    for event, elem in iterparse(xml, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            if skip_depth is None:
+                if tag == _FALLBACK:
+                    skip_depth = len(stack)
+                elif tag == _P:
+                    containers.append(_Container("paragraph"))
+                elif tag == _TC:
+                    containers.append(_Container("cell"))
+            stack.append(elem)
+            continue
+
+        stack.pop()
+        parent = stack[-1] if stack else None
+        current = containers[-1] if containers else None
+        blocks: list[DocxBlock] = []
+
+        if skip_depth is not None:
+            if len(stack) == skip_depth:
+                skip_depth = None
+        elif current is None:
+            pass
+        elif tag == _T and current.kind == "paragraph":
+            current.parts.append(elem.text or "")
+        elif tag in _RUN_BREAKS and current.kind == "paragraph" and parent.tag == _R:
+            current.parts.append(_RUN_BREAKS[tag])
+        elif tag in (_VMERGE, _HMERGE) and current.kind == "cell":
+            current.merged = elem.get(_VAL) != "restart"
+        elif tag == _P:
+            paragraph = containers.pop()
+            texts = ["".join(paragraph.parts), *paragraph.deferred]
+            blocks = _deliver(containers, "paragraph", texts)
+        elif tag == _TC:
+            cell = containers.pop()
+            text = "\n".join(part for part in cell.parts if part.strip()).strip()
+            if text and not cell.merged:
+                blocks = _deliver(containers, "cell", [text])
+
+        elem.clear()
+        if parent is not None:
+            parent.remove(elem)
+
+        for block in blocks:
+            block.offset = offset
+            yield block
+            offset += len(block.text) + 1
+
+
+def _deliver(containers: list[_Container], kind: str, texts: list[str]) -> list[DocxBlock]:
+    """Hand finished text to the enclosing container, or return it as top-level blocks."""
+    if not containers:
+        return [DocxBlock(kind, text, 0) for text in texts if text.strip()]
+    enclosing = containers[-1]
+    if enclosing.kind == "paragraph":
+        enclosing.deferred.extend(texts)
+    else:
+        enclosing.parts.extend(texts)
+    return []
@@ -1,56 +1,138 @@
-import fitz
-from docx import Document
+import asyncio
+import io
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import TypeVar
+
+import fitz
 
+from app.core.config import settings
+from app.domain.models.document import Document
 from app.domain.ports.file_loader import FileLoaderPort
+from app.domain.ports.profiler import tracked
+from app.infrastructure.adapters.docx_reader import iter_docx_blocks
+from app.infrastructure.adapters.ocr import PdfOcrFallback
+
+T = TypeVar("T")
+
+PdfSource = Path | bytes | bytearray
 
 
 class DocFileLoader(FileLoaderPort):
-    async def read(self, path: str) -> str:
-        return await _load_file(path)
+    """Reads PDF and DOCX files into documents, OCR'ing image-only PDF pages when enabled.
 
+    PyMuPDF is not thread-safe, so PDFs are parsed in a process pool of ``pdf_workers``
+    processes: every call opens its own ``fitz.Document``, one slow or abandoned parse
+    occupies a single worker, and the other documents keep going on the rest. With
+    ``pdf_workers=0`` no pool is started and PDFs are parsed on a thread of the calling
+    process, for callers that are already worker processes handling one file at a time.
+    """
 
-async def _load_file(file_path: str) -> str:
-    path = Path(file_path)
+    def __init__(
+        self, ocr: PdfOcrFallback | None = None, pdf_workers: int = settings.PDF_WORKERS
+    ) -> None:
+        self.ocr = ocr
+        self.pdf_workers = pdf_workers
+        self._pool: ProcessPoolExecutor | None = None
 
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    async def read(self, path: str) -> Document:
+        file_path = Path(path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {path}")
+        return await self._extract_text(file_path.suffix, file_path, source_path=path)
 
-    text = ""
+    async def read_bytes(self, data: bytes | bytearray, filename: str) -> Document:
+        return await self._extract_text(Path(filename).suffix, data, source_path=filename)
 
-    if path.suffix.lower() == ".pdf":
-        try:
-            with fitz.open(path) as doc:
-                for page in doc:
-                    page_text = page.get_text()
-                    if page_text:
-                        text += page_text
-        except Exception as exc:
-            raise RuntimeError(f"PDF read failed: {exc}") from exc
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
 
-    elif path.suffix.lower() == ".docx":
-        try:
-            doc = Document(path)
-            text_parts: list[str] = []
+    async def _extract_text(
+        self, suffix: str, source: PdfSource, source_path: str | None = None
+    ) -> Document:
+        suffix = suffix.lower()
+        ocr_skipped_pages: list[int] = []
+
+        if suffix == ".pdf":
+            text, ocr_skipped_pages = await self._read_pdf(source)
+        elif suffix == ".docx":
+            text = await asyncio.to_thread(tracked(_read_docx), source)
+        else:
+            raise ValueError("Unsupported file type")
 
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text_parts.append(paragraph.text)
+        if not text.strip():
+            raise ValueError("File contains no readable text (possibly scanned or image-based document)")
 
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        cell_text = cell.text.strip()
-                        if cell_text:
-                            text_parts.append(cell_text)
+        return Document(text=text.strip(), source_path=source_path, ocr_skipped_pages=ocr_skipped_pages)
 
-            text = "\n".join(text_parts)
+    async def _read_pdf(self, source: PdfSource) -> tuple[str, list[int]]:
+        """Return the PDF text and the 1-based pages left un-OCR'd by the page budget."""
+        ocr = self.ocr
+        page_texts, scanned = await self._in_pdf_worker(_pdf_page_texts, source, ocr is not None)
+        if ocr is None or not scanned:
+            return "".join(page_texts), []
+
+        # pages are rendered one at a time as OCR slots free up, so at most
+        # ``max_concurrent_pages`` page images are held in memory per document
+        budgeted, over_budget = scanned[: ocr.max_pages], scanned[ocr.max_pages :]
+        ocr_texts = await ocr.recognize(
+            budgeted,
+            lambda number: self._in_pdf_worker(_render_pdf_page, source, number, ocr.dpi),
+        )
+        for page_number, ocr_text in zip(budgeted, ocr_texts):
+            page_texts[page_number] = ocr_text
+        return "".join(page_texts), [number + 1 for number in over_budget]
+
+    async def _in_pdf_worker(self, func: Callable[..., T], *args) -> T:
+        loop = asyncio.get_running_loop()
+        if self.pdf_workers <= 0:
+            return await loop.run_in_executor(None, tracked(func), *args)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.pdf_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return await loop.run_in_executor(self._pool, func, *args)
+
+
+def _open_pdf(source: PdfSource) -> fitz.Document:
+    try:
+        if isinstance(source, Path):
+            return fitz.open(source)
+        return fitz.open(stream=source, filetype="pdf")
+    except Exception as exc:
+        raise RuntimeError(f"PDF read failed: {exc}") from exc
+
+
+def _pdf_page_texts(source: PdfSource, find_scanned: bool) -> tuple[list[str], list[int]]:
+    """Extract native text per page, plus the numbers of image-only pages when requested."""
+    page_texts: list[str] = []
+    scanned: list[int] = []
+    with _open_pdf(source) as doc:
+        try:
+            for page in doc:
+                page_text = page.get_text() or ""
+                page_texts.append(page_text)
+                if find_scanned and not page_text.strip() and page.get_images():
+                    scanned.append(page.number)
         except Exception as exc:
-            raise RuntimeError(f"DOCX read failed: {exc}") from exc
-    else:
-        raise ValueError("Unsupported file type")
+            raise RuntimeError(f"PDF read failed: {exc}") from exc
+    return page_texts, scanned
+
+
+def _render_pdf_page(source: PdfSource, page_number: int, dpi: int) -> bytes:
+    # reopened per page so any worker can take it; opening is cheap next to rendering
+    with _open_pdf(source) as doc:
+        return doc[page_number].get_pixmap(dpi=dpi).tobytes("png")
 
-    if not text.strip():
-        raise ValueError("File contains no readable text (possibly scanned or image-based document)")
 
-    return text.strip()
+def _read_docx(source: PdfSource) -> str:
+    try:
+        stream = str(source) if isinstance(source, Path) else io.BytesIO(source)
+        return "\n".join(block.text for block in iter_docx_blocks(stream))
+    except Exception as exc:
+        raise RuntimeError(f"DOCX read failed: {exc}") from exc
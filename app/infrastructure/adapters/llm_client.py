@@ -4,7 +4,8 @@ from textwrap import shorten
 from openai import AsyncOpenAI
 
 from app.core.config import settings
-from app.domain.ports.llm import LLMClientPort
+from app.domain.ports.llm import LLMClientPort, LLMRequestContext
+from app.infrastructure.adapters.llm_router import RoutingLLMClient
 
 
 class OpenAIClient(LLMClientPort):
@@ -19,10 +20,13 @@ class OpenAIClient(LLMClientPort):
         if not api_key.startswith("sk-"):
             raise ValueError("Missing or invalid OpenAI API key")
 
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = AsyncOpenAI(api_key=api_key, timeout=settings.LLM_TIMEOUT_SECONDS)
         self.model = settings.LLM_MODEL or "gpt-4o-mini"
 
-    async def generate(self, prompt: str) -> str:
+    def model_name(self, context: LLMRequestContext | None = None) -> str:
+        return self.model
+
+    async def generate(self, prompt: str, context: LLMRequestContext | None = None) -> str:
         response = await self.client.chat.completions.create(
             model=self.model,
             messages=[
@@ -35,7 +39,10 @@ class OpenAIClient(LLMClientPort):
 
 
 class LocalFallbackLLM(LLMClientPort):
-    async def generate(self, prompt: str) -> str:
+    def model_name(self, context: LLMRequestContext | None = None) -> str:
+        return "local-fallback"
+
+    async def generate(self, prompt: str, context: LLMRequestContext | None = None) -> str:
         prompt = prompt.strip()
         lowered = prompt.lower()
 
@@ -74,7 +81,16 @@ class LocalFallbackLLM(LLMClientPort):
 
 def get_llm_client() -> LLMClientPort:
     try:
-        return OpenAIClient()
+        remote = OpenAIClient()
     except Exception as exc:
         print("OpenAI client error:", exc)
         return LocalFallbackLLM()
+    if not settings.LLM_ROUTING_ENABLED:
+        return remote
+    return RoutingLLMClient(
+        local=LocalFallbackLLM(),
+        remote=remote,
+        min_chars=settings.LLM_REMOTE_MIN_CHARS,
+        min_findings=settings.LLM_REMOTE_MIN_FINDINGS,
+        risk_levels=settings.LLM_REMOTE_RISK_LEVELS,
+    )
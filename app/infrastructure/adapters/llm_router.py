@@ -0,0 +1,87 @@
+import time
+from dataclasses import dataclass
+
+from app.core.config import settings
+from app.domain.ports.llm import LLMClientPort, LLMRequestContext
+from app.domain.services.tokenizer import count_tokens
+
+
+@dataclass(slots=True)
+class RouteStats:
+    calls: int = 0
+    errors: int = 0
+    latency_ms_total: float = 0.0
+    latency_ms_max: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    def to_dict(self) -> dict[str, float | int]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "latency_ms_avg": round(self.latency_ms_total / self.calls, 2) if self.calls else 0.0,
+            "latency_ms_max": round(self.latency_ms_max, 2),
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+        }
+
+
+class RoutingLLMClient(LLMClientPort):
+    """Sends each call to the local or remote backend based on the request and stage.
+
+    Summaries go remote for long or risky documents; recommendations go remote when there
+    are findings or the risk is elevated. Everything else stays on the local generator.
+    Latency and estimated token spend are recorded per ``route:stage``.
+    """
+
+    def __init__(
+        self,
+        local: LLMClientPort,
+        remote: LLMClientPort,
+        min_chars: int = settings.LLM_REMOTE_MIN_CHARS,
+        min_findings: int = settings.LLM_REMOTE_MIN_FINDINGS,
+        risk_levels: str = settings.LLM_REMOTE_RISK_LEVELS,
+    ) -> None:
+        self.local = local
+        self.remote = remote
+        self.min_chars = min_chars
+        self.min_findings = min_findings
+        self.risk_levels = {level.strip().upper() for level in risk_levels.split(",") if level.strip()}
+        self._stats: dict[str, RouteStats] = {}
+
+    def route(self, context: LLMRequestContext | None) -> str:
+        if context is None:
+            return "remote"
+        risky = context.risk_level.upper() in self.risk_levels
+        if context.stage == "summary":
+            remote = risky or context.document_chars >= self.min_chars
+        else:
+            remote = risky or context.findings >= self.min_findings
+        return "remote" if remote else "local"
+
+    def model_name(self, context: LLMRequestContext | None = None) -> str:
+        return self._backend(self.route(context)).model_name(context)
+
+    async def generate(self, prompt: str, context: LLMRequestContext | None = None) -> str:
+        route = self.route(context)
+        stats = self._stats.setdefault(f"{route}:{context.stage if context else 'default'}", RouteStats())
+        started = time.perf_counter()
+        try:
+            output = await self._backend(route).generate(prompt, context)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            stats.calls += 1
+            stats.latency_ms_total += elapsed_ms
+            stats.latency_ms_max = max(stats.latency_ms_max, elapsed_ms)
+        stats.input_tokens += count_tokens(prompt)
+        stats.output_tokens += count_tokens(output)
+        return output
+
+    def stats(self) -> dict[str, dict[str, float | int]]:
+        return {name: stats.to_dict() for name, stats in sorted(self._stats.items())}
+
+    def _backend(self, route: str) -> LLMClientPort:
+        return self.remote if route == "remote" else self.local
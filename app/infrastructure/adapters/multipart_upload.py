@@ -0,0 +1,110 @@
+import asyncio
+import os
+from collections.abc import AsyncIterator
+
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ImportError:  # python-multipart < 0.0.13 ships the package as ``multipart``
+    from multipart.multipart import MultipartParser, parse_options_header
+
+from app.infrastructure.adapters.upload_buffer import UploadBuffer, UploadTimeoutError
+
+
+class MultipartUploadReader:
+    """Streams a ``multipart/form-data`` body into an :class:`UploadBuffer`.
+
+    The file part is written to the buffer chunk by chunk as it arrives from the socket,
+    so the payload is held exactly once and an oversized upload is rejected as soon as it
+    crosses the buffer's limit. Every other part is collected as a small text field.
+    """
+
+    def __init__(
+        self,
+        content_type: str,
+        buffer: UploadBuffer,
+        file_field: str = "file",
+        max_field_bytes: int = 64 * 1024,
+    ) -> None:
+        mime, params = parse_options_header(content_type)
+        boundary = params.get(b"boundary")
+        if mime != b"multipart/form-data" or not boundary:
+            raise ValueError("Expected a multipart/form-data request body")
+
+        self.buffer = buffer
+        self.file_field = file_field
+        self.max_field_bytes = max_field_bytes
+        self.filename: str | None = None
+        self.fields: dict[str, str] = {}
+
+        self._field_bytes = 0
+        self._headers: dict[bytes, bytes] = {}
+        self._header_field = bytearray()
+        self._header_value = bytearray()
+        self._part_name = ""
+        self._part_is_file = False
+        self._part_value = bytearray()
+        self._parser = MultipartParser(
+            boundary,
+            callbacks={
+                "on_part_begin": self._on_part_begin,
+                "on_part_data": self._on_part_data,
+                "on_part_end": self._on_part_end,
+                "on_header_field": self._on_header_field,
+                "on_header_value": self._on_header_value,
+                "on_header_end": self._on_header_end,
+                "on_headers_finished": self._on_headers_finished,
+            },
+        )
+
+    async def read(self, stream: AsyncIterator[bytes], timeout: float | None = None) -> None:
+        """Consume the body; a sender slower than ``timeout`` seconds gets UploadTimeoutError."""
+        try:
+            async with asyncio.timeout(timeout):
+                async for chunk in stream:
+                    if chunk:
+                        self._parser.write(chunk)
+        except TimeoutError:
+            raise UploadTimeoutError(f"Upload was not received within {timeout:g} seconds") from None
+        self._parser.finalize()
+        if self.filename is None:
+            raise ValueError(f"Missing '{self.file_field}' file part")
+        self.buffer.finish()
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+        self._part_value = bytearray()
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[bytes(self._header_field).lower()] = bytes(self._header_value)
+        self._header_field = bytearray()
+        self._header_value = bytearray()
+
+    def _on_headers_finished(self) -> None:
+        _, params = parse_options_header(self._headers.get(b"content-disposition", b""))
+        self._part_name = params.get(b"name", b"").decode("utf-8", "replace")
+        self._part_is_file = self._part_name == self.file_field and b"filename" in params
+        if not self._part_is_file:
+            return
+        if self.filename is not None:
+            raise ValueError(f"Only one '{self.file_field}' part may be uploaded per request")
+        self.filename = params[b"filename"].decode("utf-8", "replace")
+        self.buffer.suffix = os.path.splitext(self.filename)[1]
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._part_is_file:
+            self.buffer.write(data[start:end])
+            return
+        self._field_bytes += end - start
+        if self._field_bytes > self.max_field_bytes:
+            raise ValueError(f"Form fields exceed {self.max_field_bytes} bytes")
+        self._part_value += data[start:end]
+
+    def _on_part_end(self) -> None:
+        if not self._part_is_file:
+            self.fields[self._part_name] = self._part_value.decode("utf-8", "replace")
@@ -0,0 +1,106 @@
+import asyncio
+import hashlib
+import io
+import logging
+import multiprocessing
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+from app.core.config import settings
+from app.domain.ports.cache import CachePort
+from app.domain.ports.profiler import tracked
+from app.domain.services.cache_keys import stage_cache_key
+
+logger = logging.getLogger(__name__)
+
+
+def _ocr_image(png: bytes, language: str) -> str:
+    # Imported in the worker process so the API process does not need Pillow loaded.
+    import pytesseract
+    from PIL import Image
+
+    with Image.open(io.BytesIO(png)) as image:
+        return pytesseract.image_to_string(image, lang=language)
+
+
+class PdfOcrFallback:
+    """OCRs rendered page images in a process pool, caching text by page-image hash.
+
+    The pool is shared by every request; ``max_concurrent_pages`` caps how many of its
+    workers a single document may occupy. With ``max_workers=0`` no pool is started and
+    pages are OCR'd one at a time on a thread of the calling process, for callers that
+    are already worker processes themselves.
+    """
+
+    def __init__(
+        self,
+        cache: CachePort,
+        dpi: int = settings.OCR_DPI,
+        language: str = settings.OCR_LANGUAGE,
+        max_workers: int = settings.OCR_WORKERS,
+        max_pages: int = settings.OCR_MAX_PAGES_PER_DOCUMENT,
+        max_concurrent_pages: int = settings.OCR_MAX_CONCURRENT_PAGES,
+    ) -> None:
+        self.cache = cache
+        self.dpi = dpi
+        self.language = language
+        self.max_workers = max_workers
+        self.max_pages = max_pages
+        # more pages in flight than workers would only queue rendered images in memory
+        self.max_concurrent_pages = max(1, min(max_concurrent_pages, max_workers))
+        self._pool: ProcessPoolExecutor | None = None
+
+    async def recognize(
+        self, pages: Sequence[int], render: Callable[[int], Awaitable[bytes]]
+    ) -> list[str]:
+        """Return OCR text for each page; pages that fail to render or OCR yield "".
+
+        ``render`` produces a page's PNG and is only called once an OCR slot is free, so
+        a long scan never holds more than ``max_concurrent_pages`` images in memory.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_pages)
+
+        async def run(page: int) -> str:
+            async with semaphore:
+                try:
+                    png = await render(page)
+                except Exception as exc:
+                    logger.warning("Rendering page %d for OCR failed: %s", page + 1, exc)
+                    return ""
+                return await self._recognize_page(png)
+
+        return list(await asyncio.gather(*(run(page) for page in pages)))
+
+    async def _recognize_page(self, png: bytes) -> str:
+        key = stage_cache_key("ocr", image=hashlib.sha256(png).hexdigest(), language=self.language)
+        cached = await self.cache.get(key)
+        if cached and "text" in cached:
+            return cached["text"]
+
+        loop = asyncio.get_running_loop()
+        try:
+            executor = self._executor()
+            # inline OCR runs on a local thread and is profiled; pool workers are other processes
+            task = _ocr_image if executor is not None else tracked(_ocr_image)
+            text = await loop.run_in_executor(executor, task, png, self.language)
+        except Exception as exc:
+            logger.warning("OCR failed for page image: %s", exc)
+            return ""
+
+        await self.cache.set(key, {"text": text})
+        return text
+
+    def _executor(self) -> ProcessPoolExecutor | None:
+        if self.max_workers <= 0:
+            return None
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,70 @@
+import os
+import tempfile
+
+
+class UploadTooLargeError(ValueError):
+    """Raised when an upload exceeds the configured maximum size."""
+
+
+class UploadTimeoutError(ValueError):
+    """Raised when an upload body is not fully received within its time limit."""
+
+
+class UploadBuffer:
+    """Accumulates an upload in memory and spills it to a temp file above a threshold.
+
+    Use as a context manager: the temp file, if any, is always removed on exit.
+    """
+
+    def __init__(self, suffix: str, max_bytes: int, spool_bytes: int) -> None:
+        self.suffix = suffix
+        self.max_bytes = max_bytes
+        self.spool_bytes = spool_bytes
+        self.size = 0
+        self.path: str | None = None
+        self._memory = bytearray()
+        self._file = None
+
+    @property
+    def in_memory(self) -> bool:
+        return self.path is None
+
+    @property
+    def data(self) -> bytearray:
+        return self._memory
+
+    def write(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise UploadTooLargeError(f"File exceeds maximum upload size of {self.max_bytes} bytes")
+
+        if self._file is None and self.size > self.spool_bytes:
+            self._file = tempfile.NamedTemporaryFile(delete=False, suffix=self.suffix)
+            self.path = self._file.name
+            self._file.write(self._memory)
+            self._memory = bytearray()
+
+        if self._file is not None:
+            self._file.write(chunk)
+        else:
+            self._memory += chunk
+
+    def finish(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+    def close(self) -> None:
+        self._memory = bytearray()
+        if self._file is not None:
+            self._file.close()
+        if self.path is not None:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self) -> "UploadBuffer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
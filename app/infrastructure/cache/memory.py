@@ -1,14 +1,24 @@
+from collections import OrderedDict
 from typing import Any
 
 from app.domain.ports.cache import CachePort
 
 
 class InMemoryCache(CachePort):
-    def __init__(self) -> None:
-        self._cache: dict[str, dict[str, Any]] = {}
+    """Process-local cache that evicts the least recently used entry beyond ``max_entries``."""
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self.max_entries = max_entries
+        self._cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
 
     async def get(self, key: str) -> dict[str, Any] | None:
-        return self._cache.get(key)
+        payload = self._cache.get(key)
+        if payload is not None:
+            self._cache.move_to_end(key)
+        return payload
 
     async def set(self, key: str, payload: dict[str, Any]) -> None:
         self._cache[key] = payload.copy()
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
@@ -0,0 +1,81 @@
+import asyncio
+from collections import OrderedDict
+from typing import Any
+
+from app.domain.ports.near_duplicates import NearDuplicate, NearDuplicateIndexPort
+from app.domain.ports.profiler import tracked
+from app.domain.services.minhash import estimate_jaccard, minhash_signature
+
+
+class InMemoryNearDuplicateIndex(NearDuplicateIndexPort):
+    """LSH index over MinHash signatures, holding the reusable outputs of each document.
+
+    Signatures are split into ``bands`` bands; documents sharing any band become
+    candidates, and a candidate is returned only if its estimated Jaccard similarity
+    reaches ``threshold``. The oldest entries are evicted beyond ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 5,
+        max_entries: int = 10_000,
+    ) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[tuple[int, ...], dict[str, Any]]] = OrderedDict()
+        self._buckets: dict[tuple[int, tuple[int, ...]], set[str]] = {}
+
+    async def signature(self, text: str) -> tuple[int, ...]:
+        return await asyncio.to_thread(
+            tracked(minhash_signature), text, self.num_perm, self.shingle_size
+        )
+
+    async def find(self, signature: tuple[int, ...]) -> NearDuplicate | None:
+        if not signature:
+            return None
+        candidates: set[str] = set()
+        for band_key in self._band_keys(signature):
+            candidates.update(self._buckets.get(band_key, ()))
+
+        best: NearDuplicate | None = None
+        for document_id in candidates:
+            stored, payload = self._entries[document_id]
+            similarity = estimate_jaccard(signature, stored)
+            if similarity >= self.threshold and (best is None or similarity > best.similarity):
+                best = NearDuplicate(document_id, similarity, payload)
+        return best
+
+    async def add(self, document_id: str, signature: tuple[int, ...], payload: dict[str, Any]) -> None:
+        if not signature:
+            return
+        if document_id in self._entries:
+            self._remove(document_id)
+        self._entries[document_id] = (signature, dict(payload))
+        for band_key in self._band_keys(signature):
+            self._buckets.setdefault(band_key, set()).add(document_id)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def _band_keys(self, signature: tuple[int, ...]) -> list[tuple[int, tuple[int, ...]]]:
+        return [
+            (band, signature[band * self.rows : (band + 1) * self.rows])
+            for band in range(self.bands)
+        ]
+
+    def _remove(self, document_id: str) -> None:
+        signature, _ = self._entries.pop(document_id)
+        for band_key in self._band_keys(signature):
+            bucket = self._buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(document_id)
+                if not bucket:
+                    del self._buckets[band_key]
@@ -1,18 +1,71 @@
 from functools import lru_cache
 
+from app.application.services.admission import AdmissionController
 from app.application.services.compliance_service import ComplianceApplicationService
+from app.core.config import settings
 from app.infrastructure.adapters.file_loader import DocFileLoader
 from app.infrastructure.adapters.llm_client import get_llm_client
+from app.infrastructure.adapters.ocr import PdfOcrFallback
 from app.infrastructure.cache.memory import InMemoryCache
+from app.infrastructure.cache.near_duplicates import InMemoryNearDuplicateIndex
+from app.infrastructure.index.inverted_index import SQLiteInvertedIndex
 
 
 @lru_cache
 def get_compliance_service() -> ComplianceApplicationService:
-    file_loader = DocFileLoader()
+    cache = InMemoryCache(max_entries=settings.CACHE_MAX_ENTRIES)
+    ocr = (
+        PdfOcrFallback(
+            cache,
+            dpi=settings.OCR_DPI,
+            language=settings.OCR_LANGUAGE,
+            max_workers=settings.OCR_WORKERS,
+            max_pages=settings.OCR_MAX_PAGES_PER_DOCUMENT,
+            max_concurrent_pages=settings.OCR_MAX_CONCURRENT_PAGES,
+        )
+        if settings.OCR_ENABLED
+        else None
+    )
+    file_loader = DocFileLoader(ocr=ocr, pdf_workers=settings.PDF_WORKERS)
     llm_client = get_llm_client()
-    cache = InMemoryCache()
+    index = SQLiteInvertedIndex(settings.INDEX_PATH) if settings.INDEX_ENABLED else None
+    near_duplicates = (
+        InMemoryNearDuplicateIndex(
+            threshold=settings.NEAR_DUP_THRESHOLD,
+            num_perm=settings.NEAR_DUP_NUM_PERM,
+            bands=settings.NEAR_DUP_BANDS,
+            shingle_size=settings.NEAR_DUP_SHINGLE_SIZE,
+            max_entries=settings.NEAR_DUP_MAX_ENTRIES,
+        )
+        if settings.NEAR_DUP_ENABLED
+        else None
+    )
     return ComplianceApplicationService(
         file_loader=file_loader,
         llm_client=llm_client,
         cache=cache,
+        index=index,
+        near_duplicates=near_duplicates,
+    )
+
+
+@lru_cache
+def get_admission_controller() -> AdmissionController:
+    return AdmissionController(
+        max_in_flight=settings.ADMISSION_MAX_IN_FLIGHT,
+        max_queue=settings.ADMISSION_MAX_QUEUE,
     )
+
+
+def shutdown_services() -> None:
+    """Stop the worker pools and close the index held by the cached compliance service."""
+    if get_compliance_service.cache_info().currsize == 0:
+        return
+    service = get_compliance_service()
+    if isinstance(service.file_loader, DocFileLoader):
+        service.file_loader.close()
+        if service.file_loader.ocr is not None:
+            service.file_loader.ocr.close()
+    if isinstance(service.index, SQLiteInvertedIndex):
+        service.index.close()
+    get_compliance_service.cache_clear()
@@ -0,0 +1 @@
+"""Document index adapters."""
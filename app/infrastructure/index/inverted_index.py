@@ -0,0 +1,250 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from app.domain.ports.index import DocumentIndexPort
+from app.domain.ports.profiler import tracked
+from app.domain.services.rule_engine import rule_match_mode
+from app.domain.services.tokenizer import iter_terms
+
+_BUSY_TIMEOUT_SECONDS = 30.0
+# candidate documents fetched per round trip; below SQLite's bound-parameter limit
+_CANDIDATE_BATCH = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    doc_id INTEGER PRIMARY KEY,
+    content_hash TEXT NOT NULL UNIQUE,
+    source TEXT,
+    indexed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS terms (
+    term TEXT PRIMARY KEY,
+    doc_count INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def encode_varints(values: Iterable[int]) -> bytes:
+    out = bytearray()
+    for value in values:
+        while value >= 0x80:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+    return bytes(out)
+
+
+def decode_varints(data: bytes) -> list[int]:
+    values: list[int] = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+    return values
+
+
+def _deltas(values: list[int]) -> list[int]:
+    return [value - previous for previous, value in zip([0, *values], values)]
+
+
+def _undelta(deltas: list[int]) -> list[int]:
+    total = 0
+    values = []
+    for delta in deltas:
+        total += delta
+        values.append(total)
+    return values
+
+
+def encode_posting(positions: list[int], offsets: list[int]) -> bytes:
+    """Varint-encode a posting as ``count``, delta positions, then delta offsets."""
+    return encode_varints([len(positions), *_deltas(positions), *_deltas(offsets)])
+
+
+def decode_posting(payload: bytes) -> tuple[list[int], list[int]]:
+    values = decode_varints(payload)
+    count = values[0]
+    return _undelta(values[1 : count + 1]), _undelta(values[count + 1 :])
+
+
+class SQLiteInvertedIndex(DocumentIndexPort):
+    """On-disk inverted index of normalized terms with per-document positional postings.
+
+    Each ``(term, document)`` posting stores token positions (for phrase queries) and
+    character offsets, delta- and varint-encoded. Matching is on whole normalized words,
+    so a rule keyword only matches where it appears as a word or word sequence; only
+    rule packs in "word" match mode can be evaluated here. Per-term document counts let
+    a query start from its rarest term and look up the others only in those documents.
+    """
+
+    def __init__(self, path: str) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # several processes (e.g. scan_corpus workers) may write the same file; wait for
+        # their write locks instead of failing fast with "database is locked"
+        self._conn = sqlite3.connect(path, timeout=_BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._backfill_doc_counts()
+
+    async def add(self, document_id: str, text: str, source: str | None = None) -> None:
+        await asyncio.to_thread(tracked(self._add), document_id, text, source)
+
+    async def search(self, query: str, limit: int = 100) -> list[dict[str, Any]]:
+        return await asyncio.to_thread(self._search, query, limit)
+
+    async def evaluate_rules(self, rules: dict, limit: int = 100) -> dict[str, list[dict[str, Any]]]:
+        if rule_match_mode(rules) != "word":
+            raise ValueError(
+                'The index matches whole words only; set "match": "word" on the rule pack'
+            )
+        keywords = [k for k in rules.get("forbidden_keywords", []) or [] if k and k.strip()]
+        return await asyncio.to_thread(
+            lambda: {keyword: self._search(keyword, limit) for keyword in keywords}
+        )
+
+    def _backfill_doc_counts(self) -> None:
+        # indexes written before per-term document counts were kept
+        with self._conn:
+            has_counts = self._conn.execute("SELECT 1 FROM terms LIMIT 1").fetchone()
+            if has_counts is None:
+                self._conn.execute(
+                    "INSERT INTO terms (term, doc_count) "
+                    "SELECT term, COUNT(*) FROM postings GROUP BY term"
+                )
+
+    def _add(self, document_id: str, text: str, source: str | None) -> None:
+        postings: dict[str, tuple[list[int], list[int]]] = {}
+        for term, position, offset in iter_terms(text):
+            positions, offsets = postings.setdefault(term, ([], []))
+            positions.append(position)
+            offsets.append(offset)
+
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO documents (content_hash, source, indexed_at) VALUES (?, ?, ?)",
+                (document_id, source, time.time()),
+            )
+            if cursor.rowcount == 0:
+                return  # already indexed
+            doc_id = cursor.lastrowid
+            self._conn.executemany(
+                "INSERT INTO postings (term, doc_id, payload) VALUES (?, ?, ?)",
+                (
+                    (term, doc_id, encode_posting(positions, offsets))
+                    for term, (positions, offsets) in postings.items()
+                ),
+            )
+            self._conn.executemany(
+                "INSERT INTO terms (term, doc_count) VALUES (?, 1) "
+                "ON CONFLICT (term) DO UPDATE SET doc_count = doc_count + 1",
+                ((term,) for term in postings),
+            )
+
+    def _search(self, query: str, limit: int) -> list[dict[str, Any]]:
+        terms = [term for term, _, _ in iter_terms(query)]
+        if not terms:
+            return []
+
+        with self._lock:
+            doc_counts = self._doc_counts(set(terms))
+            if len(doc_counts) < len(set(terms)):
+                return []
+            rarest, *others = sorted(doc_counts, key=doc_counts.__getitem__)
+
+            # walk the rarest term's documents in batches, fetching the other terms only for
+            # those documents, and stop as soon as ``limit`` documents have matched
+            hits: list[dict[str, Any]] = []
+            after = 0
+            while len(hits) < limit:
+                batch = self._postings_after(rarest, after)
+                if not batch:
+                    break
+                after = max(batch)
+                by_term = {rarest: batch}
+                for term in others:
+                    by_term[term] = self._postings_in(term, list(batch))
+                for doc_id in batch:
+                    if not all(doc_id in by_term[term] for term in others):
+                        continue
+                    offsets = self._phrase_offsets(terms, by_term, doc_id)
+                    if offsets:
+                        hits.append({"doc_id": doc_id, "offsets": offsets})
+                        if len(hits) >= limit:
+                            break
+            return self._attach_documents(hits)
+
+    def _doc_counts(self, terms: set[str]) -> dict[str, int]:
+        placeholders = ",".join("?" * len(terms))
+        rows = self._conn.execute(
+            f"SELECT term, doc_count FROM terms WHERE term IN ({placeholders})", list(terms)
+        )
+        return dict(rows.fetchall())
+
+    def _postings_after(self, term: str, after: int) -> dict[int, bytes]:
+        rows = self._conn.execute(
+            "SELECT doc_id, payload FROM postings WHERE term = ? AND doc_id > ? "
+            "ORDER BY doc_id LIMIT ?",
+            (term, after, _CANDIDATE_BATCH),
+        )
+        return dict(rows.fetchall())
+
+    def _postings_in(self, term: str, doc_ids: list[int]) -> dict[int, bytes]:
+        placeholders = ",".join("?" * len(doc_ids))
+        rows = self._conn.execute(
+            f"SELECT doc_id, payload FROM postings WHERE term = ? AND doc_id IN ({placeholders})",
+            [term, *doc_ids],
+        )
+        return dict(rows.fetchall())
+
+    @staticmethod
+    def _phrase_offsets(
+        terms: list[str], by_term: dict[str, dict[int, bytes]], doc_id: int
+    ) -> list[int]:
+        decoded = {term: decode_posting(postings[doc_id]) for term, postings in by_term.items()}
+        first_positions, first_offsets = decoded[terms[0]]
+        if len(terms) == 1:
+            return first_offsets
+        following = [set(decoded[term][0]) for term in terms[1:]]
+        return [
+            offset
+            for position, offset in zip(first_positions, first_offsets)
+            if all(position + step in positions for step, positions in enumerate(following, 1))
+        ]
+
+    def _attach_documents(self, hits: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if not hits:
+            return []
+        placeholders = ",".join("?" * len(hits))
+        rows = self._conn.execute(
+            f"SELECT doc_id, content_hash, source FROM documents WHERE doc_id IN ({placeholders})",
+            [hit["doc_id"] for hit in hits],
+        )
+        documents = {doc_id: (content_hash, source) for doc_id, content_hash, source in rows}
+        return [
+            {
+                "document": documents[hit["doc_id"]][0],
+                "source": documents[hit["doc_id"]][1],
+                "offsets": hit["offsets"],
+            }
+            for hit in hits
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,148 @@
+import asyncio
+import json
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from types import FrameType
+
+from app.domain.ports.profiler import ProfilerPort, active_profiler
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    label = f"{code.co_qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+    return label.replace(";", ",")
+
+
+class RequestProfiler(ProfilerPort):
+    """Sampling profiler and stage tracer for a single pipeline execution.
+
+    A background thread samples, at a fixed interval, only the work done for this
+    execution: the event-loop thread while it is running the task that called ``start``
+    (so idle loop time and other requests' steps are left out), plus worker threads while
+    they run functions registered through ``track_thread``. Each sample is tagged with the
+    pipeline stage active at that moment. On ``stop`` it writes ``<id>.folded`` (collapsed
+    stacks for flamegraph.pl / speedscope) and ``<id>.trace.json`` (Chrome trace events
+    for the stage spans, for Perfetto), then deletes the oldest profiles beyond
+    ``max_profiles``.
+    """
+
+    def __init__(self, output_dir: str, interval_ms: float = 5.0, max_profiles: int = 100) -> None:
+        self.profile_id = uuid.uuid4().hex
+        self.output_dir = Path(output_dir)
+        self.interval = interval_ms / 1000
+        self.max_profiles = max_profiles
+        self._samples: Counter[str] = Counter()
+        self._spans: list[dict] = []
+        self._stages: list[str] = []
+        self._origin = time.perf_counter()
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task | None = None
+        self._loop_thread = 0
+        self._threads: dict[int, str] = {}
+        self._threads_lock = threading.Lock()
+        self._token = None
+
+    def start(self) -> None:
+        self._origin = time.perf_counter()
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.current_task()
+        self._loop_thread = threading.get_ident()
+        self._token = active_profiler.set(self)
+        self._sampler = threading.Thread(target=self._sample_loop, name="request-profiler", daemon=True)
+        self._sampler.start()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        self._stages.append(name)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._stages.pop()
+            self._spans.append(
+                {
+                    "name": name,
+                    "ph": "X",
+                    "ts": (started - self._origin) * 1e6,
+                    "dur": (time.perf_counter() - started) * 1e6,
+                    "pid": 0,
+                    "tid": threading.get_ident(),
+                }
+            )
+
+    @contextmanager
+    def track_thread(self) -> Iterator[None]:
+        thread = threading.current_thread()
+        with self._threads_lock:
+            self._threads[thread.ident] = thread.name
+        try:
+            yield
+        finally:
+            with self._threads_lock:
+                self._threads.pop(thread.ident, None)
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._token is not None:
+            active_profiler.reset(self._token)
+            self._token = None
+        # joining the sampler and writing the files would block the event loop
+        await asyncio.to_thread(self._finish)
+
+    def _finish(self) -> None:
+        if self._sampler is not None:
+            self._sampler.join()
+        self._write()
+        self._prune()
+
+    def _sample_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            stage = self._stages[-1] if self._stages else "request"
+            with self._threads_lock:
+                threads = dict(self._threads)
+            if self._loop is not None and asyncio.current_task(self._loop) is self._task:
+                threads[self._loop_thread] = "event-loop"
+            if not threads:
+                continue
+            frames = sys._current_frames()
+            for thread_id, thread_name in threads.items():
+                frame = frames.get(thread_id)
+                stack: list[str] = []
+                while frame is not None:
+                    stack.append(_frame_label(frame))
+                    frame = frame.f_back
+                if not stack:
+                    continue
+                stack.reverse()
+                self._samples[";".join([f"{thread_name};stage:{stage}", *stack])] += 1
+
+    def _write(self) -> tuple[Path, Path]:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        folded = self.output_dir / f"{self.profile_id}.folded"
+        trace = self.output_dir / f"{self.profile_id}.trace.json"
+        folded.write_text(
+            "".join(f"{stack} {count}\n" for stack, count in self._samples.most_common()),
+            encoding="utf-8",
+        )
+        trace.write_text(json.dumps({"traceEvents": self._spans}), encoding="utf-8")
+        return folded, trace
+
+    def _prune(self) -> None:
+        profiles = []
+        for folded in self.output_dir.glob("*.folded"):
+            try:
+                profiles.append((folded.stat().st_mtime, folded))
+            except FileNotFoundError:  # pruned concurrently by another request
+                continue
+        profiles.sort(reverse=True)
+        for _, folded in profiles[self.max_profiles :]:
+            folded.unlink(missing_ok=True)
+            folded.with_suffix(".trace.json").unlink(missing_ok=True)
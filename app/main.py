@@ -1,15 +1,35 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from app.api.middleware import AdmissionMiddleware
 from app.api.v1.routers import compliance
+from app.infrastructure.container import get_admission_controller, shutdown_services
+
+COMPLIANCE_PREFIX = "/api/v1/compliance"
+
+
+@asynccontextmanager
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+    yield
+    # PDF and OCR worker processes would otherwise outlive a server reload
+    shutdown_services()
 
 
 def create_app() -> FastAPI:
-    application = FastAPI(title="AI Compliance Workflow")
+    application = FastAPI(title="AI Compliance Workflow", lifespan=lifespan)
     application.include_router(
         compliance.router,
-        prefix="/api/v1/compliance",
+        prefix=COMPLIANCE_PREFIX,
         tags=["compliance"],
     )
+    application.add_middleware(
+        AdmissionMiddleware,
+        admission=get_admission_controller(),
+        text_paths={f"{COMPLIANCE_PREFIX}/check"},
+        upload_paths={f"{COMPLIANCE_PREFIX}/check-file"},
+    )
 
     @application.get("/health")
     async def health() -> dict[str, str]:
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional, Union
 
 class ComplianceRequest(BaseModel):
     document_text: Optional[str] = None
@@ -10,9 +10,19 @@ class ComplianceRequest(BaseModel):
 class ComplianceResponse(BaseModel):
     status: str
     summary: Optional[str] = None
-    findings: List = []
+    findings: Union[List, Dict] = []
+    findings_page: Optional[Dict] = None
     sentiment: Optional[Dict] = None
     score: Optional[int] = None
     recommendations: Optional[str] = None
     tokens: Optional[Dict[str, int]] = None
     risk_level: Optional[str] = None
+    skipped_stages: List[str] = []
+    ocr_skipped_pages: List[int] = []
+    reused_from: Optional[Dict] = None
+
+
+class IndexRulesRequest(BaseModel):
+    rules: Dict = {}
+    # matching documents per keyword, bounded like /index/search
+    limit: int = Field(100, ge=1, le=1000)
@@ -0,0 +1,3 @@
+#!/bin/bash
+echo "📚 Scanning document corpus..."
+python -m app.cli.scan_corpus "$@"
@@ -1,9 +1,8 @@
-import json
-
 import streamlit as st
-import requests
 import plotly.graph_objects as go
 
+from utils.api_client import get_api_client
+
 # ---------------- PAGE CONFIG ----------------
 st.set_page_config(page_title="dY AI Compliance Checker", layout="wide")
 
@@ -157,33 +156,27 @@ with left:
         st.info("Select one or more files to enable the workflow.")
 
 reports = []
-session = requests.Session()
-
-
-@st.cache_data(show_spinner=False, ttl=600)
-def analyze_document(file_bytes: bytes, filename: str, keywords: tuple[str, ...], sector: str):
-    keyword_payload = ",".join(keywords)
-    response = session.post(
-        "http://127.0.0.1:8000/api/v1/compliance/check-file",
-        files={"file": (filename, file_bytes)},
-        data={"forbidden_keywords": keyword_payload, "sector": sector},
-    )
-    return response.status_code, response.text
+client = get_api_client()
 
 # ---------------- PROCESS FILES ----------------
 if uploaded_files and run:
-    keywords_tuple = tuple(forbidden_keywords)
-    for file in uploaded_files:
-        with st.spinner(f"Analyzing {file.name}..."):
-            try:
-                file_bytes = file.getvalue()
-                status, payload = analyze_document(file_bytes, file.name, keywords_tuple, sector)
-                if status == 200:
-                    reports.append((file.name, json.loads(payload)))
-                else:
-                    st.error(f"{file.name}: API error ({status}) - {payload}")
-            except Exception as exc:
-                st.error(f"{file.name}: Connection failed - {exc}")
+    files = [(file.name, file.getvalue()) for file in uploaded_files]
+    # Sector is display-only today; the backend ignores it, so it is not part of the request.
+    progress = st.progress(0.0, text="Uploading documents...")
+
+    def report_progress(done: int, total: int, name: str) -> None:
+        label = f"Analyzed {name} ({done}/{total})" if name else f"Analyzing {total} document(s)..."
+        progress.progress(done / total if total else 1.0, text=label)
+
+    results = client.check_files(files, forbidden_keywords, on_progress=report_progress)
+    progress.empty()
+    for (name, _), (status, payload) in zip(files, results):
+        if status == 200:
+            reports.append((name, payload))
+        elif status == 0:
+            st.error(f"{name}: {payload}")
+        else:
+            st.error(f"{name}: API error ({status}) - {payload}")
 
 # ---------------- RESULTS ----------------
 with right:
@@ -196,13 +189,18 @@ with right:
         )
 
     for idx, (name, data) in enumerate(reports):
-        score = data.get("score", 0)
-        status = "Compliant" if score >= 80 else "Review" if score >= 50 else "High Risk"
-        sentiment = data.get("sentiment", {}).get("sentiment", "N/A")
+        score = data.get("score")
+        sentiment = (data.get("sentiment") or {}).get("sentiment", "N/A")
+        if score is None:
+            # the score is omitted when a stage it depends on did not finish in time
+            status, badge = "Not scored", "warn"
+        else:
+            status = "Compliant" if score >= 80 else "Review" if score >= 50 else "High Risk"
+            badge = "ok" if score >= 80 else "warn" if score >= 50 else "bad"
         findings = data.get("findings", [])
         tokens = data.get("tokens", {})
-        risk = data.get("risk_level", "LOW")
-        badge = "ok" if score >= 80 else "warn" if score >= 50 else "bad"
+        risk = data.get("risk_level") or "N/A"
+        skipped = data.get("skipped_stages", [])
 
         with st.container():
             st.markdown(
@@ -220,9 +218,29 @@ with right:
                 unsafe_allow_html=True,
             )
 
+            if skipped:
+                st.warning(
+                    "Partial report: the latency budget ran out before these stages finished - "
+                    + ", ".join(skipped)
+                )
+
+            ocr_skipped = data.get("ocr_skipped_pages", [])
+            if ocr_skipped:
+                st.warning(
+                    "Partial report: these scanned pages exceeded the OCR page budget and were not read - "
+                    + ", ".join(str(page) for page in ocr_skipped)
+                )
+
+            reused = data.get("reused_from")
+            if reused:
+                st.info(
+                    f"Near-duplicate of a previously analyzed document "
+                    f"({reused.get('similarity', 0):.0%} similar); reused: {', '.join(reused.get('stages', []))}."
+                )
+
             metric_cols = st.columns(4, gap="medium")
             metric_cols[0].markdown(
-                f"<div class='metric-card'><h4>Score</h4><div class='value'>{score}%</div></div>",
+                f"<div class='metric-card'><h4>Score</h4><div class='value'>{'N/A' if score is None else f'{score}%'}</div></div>",
                 unsafe_allow_html=True,
             )
             metric_cols[1].markdown(
@@ -295,20 +313,23 @@ with right:
                         st.info("Token usage data not available.")
                 with token_cols[1]:
                     st.write("Risk Meter")
-                    gauge_value = 90 if risk == "LOW" else 60 if risk == "MEDIUM" else 30
-                    g = go.Figure(
-                        go.Indicator(
-                            mode="gauge+number",
-                            value=gauge_value,
-                            gauge={"axis": {"range": [0, 100]}},
+                    if risk == "N/A":
+                        st.info("Risk level not available for this partial report.")
+                    else:
+                        gauge_value = 90 if risk == "LOW" else 60 if risk == "MEDIUM" else 30
+                        g = go.Figure(
+                            go.Indicator(
+                                mode="gauge+number",
+                                value=gauge_value,
+                                gauge={"axis": {"range": [0, 100]}},
+                            )
+                        )
+                        g.update_layout(
+                            height=320,
+                            margin=dict(l=10, r=10, t=40, b=10),
+                        )
+                        st.plotly_chart(
+                            g,
+                            width="content",
+                            key=f"plotly_risk_{idx}_{name}",
                         )
-                    )
-                    g.update_layout(
-                        height=320,
-                        margin=dict(l=10, r=10, t=40, b=10),
-                    )
-                    st.plotly_chart(
-                        g,
-                        width="content",
-                        key=f"plotly_risk_{idx}_{name}",
-                    )
@@ -1,34 +1,200 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-API_URL_JSON = "http://localhost:8000/api/v1/compliance/check"
-API_URL_FILE = "http://localhost:8000/api/v1/compliance/check-file"
+API_BASE_URL = "http://localhost:8000/api/v1/compliance"
+API_URL_JSON = f"{API_BASE_URL}/check"
+API_URL_FILE = f"{API_BASE_URL}/check-file"
 
-def send_text_to_api(text: str):
-    payload = {
-        "document_text": text,
-        "rules": {
-            "forbidden_keywords": [k.strip() for k in st.session_state.get("keywords", "").split(",") if k.strip()]
-        }
-    }
-    try:
-        r = requests.post(API_URL_JSON, json=payload, timeout=60)
-        return r.json()
-    except Exception as e:
-        return {"error": str(e)}
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 120
+MAX_PARALLEL_UPLOADS = 4
+RESULT_TTL_SECONDS = 600
+MAX_CACHED_RESULTS = 256
+# 429 responses from admission control are retried after their Retry-After delay
+RATE_LIMIT_RETRIES = 3
+MAX_RETRY_AFTER_SECONDS = 30
 
-def send_file_to_api(file_path: str):
-    files = {"file": open(file_path, "rb")}
-    data = {
-        "forbidden_keywords": st.session_state.get("keywords", "")
-    }
+
+class ComplianceApiClient:
+    """Pooled HTTP client for the compliance API with per-file result memoization.
+
+    Successful results are memoized by file hash and keywords for ``result_ttl`` seconds,
+    keeping at most ``max_results`` entries (least recently used are dropped first).
+    Only connection failures are retried at the transport level, since an analysis POST
+    may not be safe to repeat once sent; a 429 is retried after its ``Retry-After``.
+    """
+
+    def __init__(
+        self,
+        base_url: str = API_BASE_URL,
+        max_workers: int = MAX_PARALLEL_UPLOADS,
+        result_ttl: float = RESULT_TTL_SECONDS,
+        max_results: int = MAX_CACHED_RESULTS,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.max_workers = max_workers
+        self.result_ttl = result_ttl
+        self.max_results = max_results
+        self.session = requests.Session()
+        retry = Retry(total=2, connect=2, read=0, status=0, other=0, backoff_factor=0.3)
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._results: OrderedDict[str, tuple[float, tuple[int, dict]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def check_text(self, text: str, keywords: Iterable[str]) -> dict:
+        payload = {"document_text": text, "rules": {"forbidden_keywords": list(keywords)}}
+        try:
+            response = self._post(f"{self.base_url}/check", json=payload)
+            if response.status_code == 429:
+                return {"error": _busy_message(response)}
+            return response.json()
+        except Exception as exc:
+            return {"error": str(exc)}
+
+    def check_files(
+        self,
+        files: list[tuple[str, bytes]],
+        keywords: Iterable[str],
+        on_progress: Callable[[int, int, str], None] | None = None,
+    ) -> list[tuple[int, dict | str]]:
+        """Analyze ``(filename, content)`` pairs, returning ``(status, payload)`` in input order.
+
+        Files already analyzed with the same keywords are served from memory; the rest are
+        uploaded in parallel over the pooled session.
+        """
+        keywords = tuple(keywords)
+        results: list[tuple[int, dict | str] | None] = [None] * len(files)
+        pending: list[tuple[int, str, bytes, str]] = []
+        for position, (name, content) in enumerate(files):
+            key = self._result_key(content, keywords)
+            cached = self._cached(key)
+            if cached is not None:
+                results[position] = cached
+            else:
+                pending.append((position, name, content, key))
+
+        total = len(files)
+        done = total - len(pending)
+        if on_progress:
+            on_progress(done, total, "")
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                pool.submit(self._check_file, name, content, keywords): (position, name, key)
+                for position, name, content, key in pending
+            }
+            for future in as_completed(futures):
+                position, name, key = futures[future]
+                outcome = future.result()
+                results[position] = outcome
+                if outcome[0] == 200:
+                    self._remember(key, outcome)
+                done += 1
+                if on_progress:
+                    on_progress(done, total, name)
+        return results
+
+    def check_file(self, name: str, content: bytes, keywords: Iterable[str]) -> tuple[int, dict | str]:
+        return self.check_files([(name, content)], keywords)[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+    def _cached(self, key: str) -> tuple[int, dict] | None:
+        with self._lock:
+            entry = self._results.get(key)
+            if entry is None:
+                return None
+            stored_at, outcome = entry
+            if time.monotonic() - stored_at > self.result_ttl:
+                del self._results[key]
+                return None
+            self._results.move_to_end(key)
+            return outcome
+
+    def _remember(self, key: str, outcome: tuple[int, dict]) -> None:
+        with self._lock:
+            self._results[key] = (time.monotonic(), outcome)
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_results:
+                self._results.popitem(last=False)
+
+    def _check_file(self, name: str, content: bytes, keywords: tuple[str, ...]) -> tuple[int, dict | str]:
+        try:
+            response = self._post(
+                f"{self.base_url}/check-file",
+                files={"file": (name, content)},
+                data={"forbidden_keywords": ",".join(keywords)},
+            )
+        except Exception as exc:
+            return 0, f"Connection failed - {exc}"
+        return _decode(response)
+
+    def _post(self, url: str, **kwargs) -> requests.Response:
+        for _ in range(RATE_LIMIT_RETRIES):
+            response = self.session.post(url, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT), **kwargs)
+            if response.status_code != 429:
+                return response
+            time.sleep(_retry_after(response))
+        return self.session.post(url, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT), **kwargs)
+
+    @staticmethod
+    def _result_key(content: bytes, keywords: tuple[str, ...]) -> str:
+        digest = hashlib.sha256(content)
+        digest.update(b"\0" + ",".join(keywords).encode("utf-8"))
+        return digest.hexdigest()
+
+
+def _retry_after(response: requests.Response) -> float:
     try:
-        r = requests.post(API_URL_FILE, files=files, data=data, timeout=120)
-        return r.json()
-    except Exception as e:
-        return {"error": str(e)}
-    finally:
+        delay = float(response.headers.get("Retry-After", 1))
+    except ValueError:  # an HTTP date; the API itself always sends seconds
+        delay = 1.0
+    return min(max(delay, 0.0), MAX_RETRY_AFTER_SECONDS)
+
+
+def _busy_message(response: requests.Response) -> str:
+    return f"Server is busy - try again in {_retry_after(response):g} s"
+
+
+def _decode(response: requests.Response) -> tuple[int, dict | str]:
+    if response.status_code == 200:
         try:
-            files["file"].close()
-        except Exception:
-            pass
+            return 200, response.json()
+        except ValueError:
+            return 0, f"Invalid JSON response - {response.text[:200]}"
+    if response.status_code == 429:
+        return 429, _busy_message(response)
+    return response.status_code, response.text
+
+
+@st.cache_resource(show_spinner=False)
+def get_api_client() -> ComplianceApiClient:
+    return ComplianceApiClient()
+
+
+def _session_keywords() -> list[str]:
+    return [k.strip() for k in st.session_state.get("keywords", "").split(",") if k.strip()]
+
+
+def send_text_to_api(text: str):
+    return get_api_client().check_text(text, _session_keywords())
+
+
+def send_file_to_api(file_path: str):
+    with open(file_path, "rb") as handle:
+        content = handle.read()
+    status, payload = get_api_client().check_file(file_path.rsplit("/", 1)[-1], content, _session_keywords())
+    return payload if status == 200 else {"error": payload}
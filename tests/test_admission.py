@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from app.application.services.admission import (
+    PRIORITY_LARGE_FILE,
+    PRIORITY_SMALL_FILE,
+    PRIORITY_TEXT,
+    AdmissionController,
+    AdmissionRejected,
+)
+
+
+async def _hold(
+    controller: AdmissionController, priority: int, order: list[str], name: str, release: asyncio.Event
+) -> None:
+    async with controller.admit(priority):
+        order.append(name)
+        await release.wait()
+
+
+def test_freed_slot_goes_to_highest_priority_then_oldest_waiter():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=10)
+        order: list[str] = []
+        release = asyncio.Event()
+        release.set()
+
+        blocker = asyncio.Event()
+        first = asyncio.create_task(_hold(controller, PRIORITY_TEXT, order, "running", blocker))
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.create_task(_hold(controller, PRIORITY_LARGE_FILE, order, "large", release)),
+            asyncio.create_task(_hold(controller, PRIORITY_SMALL_FILE, order, "small-1", release)),
+            asyncio.create_task(_hold(controller, PRIORITY_TEXT, order, "text", release)),
+            asyncio.create_task(_hold(controller, PRIORITY_SMALL_FILE, order, "small-2", release)),
+        ]
+        await asyncio.sleep(0)
+        assert controller.in_flight == 1 and controller.queued == 4
+
+        blocker.set()
+        await asyncio.gather(first, *waiters)
+        return order, controller.in_flight, controller.queued
+
+    order, in_flight, queued = asyncio.run(scenario())
+    assert order == ["running", "text", "small-1", "small-2", "large"]
+    assert (in_flight, queued) == (0, 0)
+
+
+def test_full_queue_rejects_with_retry_after():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=1)
+        blocker = asyncio.Event()
+        holder = asyncio.create_task(_hold(controller, PRIORITY_TEXT, [], "running", blocker))
+        queued = asyncio.create_task(_hold(controller, PRIORITY_TEXT, [], "queued", blocker))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected) as rejected:
+            async with controller.admit(PRIORITY_TEXT):
+                pass
+        blocker.set()
+        await asyncio.gather(holder, queued)
+        return rejected.value.retry_after
+
+    assert asyncio.run(scenario()) >= 1
+
+
+def test_queue_timeout_rejects_and_leaves_no_waiter_behind():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=4)
+        blocker = asyncio.Event()
+        holder = asyncio.create_task(_hold(controller, PRIORITY_TEXT, [], "running", blocker))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected):
+            async with controller.admit(PRIORITY_TEXT, timeout=0.01):
+                pass
+        queued_after_timeout = controller.queued
+        blocker.set()
+        await holder
+        return queued_after_timeout, controller.in_flight
+
+    assert asyncio.run(scenario()) == (0, 0)
+
+
+def test_cancelled_waiter_does_not_leak_its_slot():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=4)
+        blocker = asyncio.Event()
+        holder = asyncio.create_task(_hold(controller, PRIORITY_TEXT, [], "running", blocker))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(_hold(controller, PRIORITY_TEXT, [], "cancelled", blocker))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        blocker.set()
+        await holder
+
+        async with controller.admit(PRIORITY_TEXT):
+            admitted = controller.in_flight
+        return admitted, controller.in_flight, controller.queued
+
+    assert asyncio.run(scenario()) == (1, 0, 0)
@@ -0,0 +1,75 @@
+import pytest
+
+pytest.importorskip("streamlit")
+
+from streamlit_app.utils import api_client  # noqa: E402
+from streamlit_app.utils.api_client import ComplianceApiClient  # noqa: E402
+
+
+class _Response:
+    def __init__(self, status_code: int, payload=None, headers: dict | None = None) -> None:
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+        self.text = str(payload)
+
+    def json(self):
+        return self._payload
+
+
+class _Session:
+    """Replays canned responses and records every POST."""
+
+    def __init__(self, *responses: _Response) -> None:
+        self.responses = list(responses)
+        self.posts: list[str] = []
+
+    def post(self, url: str, **kwargs) -> _Response:
+        self.posts.append(kwargs["files"]["file"][0] if "files" in kwargs else url)
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    recorded: list[float] = []
+    monkeypatch.setattr(api_client.time, "sleep", recorded.append)
+    return recorded
+
+
+def _client(session: _Session) -> ComplianceApiClient:
+    client = ComplianceApiClient(max_workers=1)
+    client.session = session
+    return client
+
+
+def test_transport_retries_only_connection_errors():
+    retry = ComplianceApiClient().session.get_adapter("http://localhost").max_retries
+    assert retry.connect == 2
+    assert (retry.read, retry.status, retry.other) == (0, 0, 0)
+    assert not retry.status_forcelist
+
+
+def test_rate_limited_upload_waits_for_retry_after(sleeps):
+    session = _Session(_Response(429, headers={"Retry-After": "2"}), _Response(200, {"score": 90}))
+    assert _client(session).check_file("a.pdf", b"pdf", ["secret"]) == (200, {"score": 90})
+    assert session.posts == ["a.pdf", "a.pdf"] and sleeps == [2.0]
+
+
+def test_rate_limit_gives_up_after_bounded_retries(sleeps):
+    busy = _Response(429, headers={"Retry-After": "120"})
+    session = _Session(*[busy] * (api_client.RATE_LIMIT_RETRIES + 1))
+    status, message = _client(session).check_file("a.pdf", b"pdf", [])
+    assert status == 429 and "busy" in message
+    assert sleeps == [api_client.MAX_RETRY_AFTER_SECONDS] * api_client.RATE_LIMIT_RETRIES
+
+
+def test_results_keep_input_order_and_successes_are_memoized(sleeps):
+    session = _Session(_Response(200, {"score": 1}), _Response(400, "unreadable"))
+    client = _client(session)
+    files = [("a.pdf", b"aaa"), ("b.pdf", b"bbb")]
+    assert client.check_files(files, ["x"]) == [(200, {"score": 1}), (400, "unreadable")]
+
+    session.responses = [_Response(200, {"score": 2})]
+    assert client.check_files(files, ["x"]) == [(200, {"score": 1}), (200, {"score": 2})]
+    assert session.posts == ["a.pdf", "b.pdf", "b.pdf"]  # a.pdf came from memory
+    assert sleeps == []
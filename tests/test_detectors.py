@@ -1,2 +1,40 @@
+import pytest
+
+
 def test_detectors_dummy():
     assert True
+
+
+def test_rule_checks_match_substrings_by_default():
+    from app.domain.services.rule_engine import run_rule_checks
+
+    text = "Passwords are stored. The secretary keeps a data-leak log."
+    result = run_rule_checks(text, {"forbidden_keywords": ["password", "SECRET", "data leak", ""]})
+    assert result == {
+        "failed": True,
+        "findings": [
+            {"match": "password", "offsets": [0], "ends": [8]},
+            {"match": "SECRET", "offsets": [26], "ends": [32]},
+        ],
+    }
+
+
+def test_rule_checks_match_whole_words_and_phrases():
+    from app.domain.services.rule_engine import run_rule_checks
+
+    text = "Secret plans. The secretary keeps a data-leak log; no data leaked."
+    rules = {"forbidden_keywords": ["secret", "data leak", "missing", ""], "match": "word"}
+    assert run_rule_checks(text, rules) == {
+        "failed": True,
+        "findings": [
+            {"match": "secret", "offsets": [0], "ends": [6]},
+            {"match": "data leak", "offsets": [36], "ends": [45]},
+        ],
+    }
+
+
+def test_unknown_match_mode_is_rejected():
+    from app.domain.services.rule_engine import run_rule_checks
+
+    with pytest.raises(ValueError):
+        run_rule_checks("text", {"forbidden_keywords": ["text"], "match": "regex"})
@@ -0,0 +1,80 @@
+import io
+import zipfile
+
+from app.infrastructure.adapters.docx_reader import iter_docx_blocks
+
+_NAMESPACES = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"'
+)
+
+
+def _docx(body: str) -> io.BytesIO:
+    data = io.BytesIO()
+    with zipfile.ZipFile(data, "w") as archive:
+        archive.writestr("word/document.xml", f"<w:document {_NAMESPACES}><w:body>{body}</w:body></w:document>")
+    data.seek(0)
+    return data
+
+
+def _p(*runs: str) -> str:
+    return "<w:p>" + "".join(f"<w:r>{run}</w:r>" for run in runs) + "</w:p>"
+
+
+def _t(text: str) -> str:
+    return f"<w:t>{text}</w:t>"
+
+
+def _tc(content: str, merge: str | None = None) -> str:
+    props = ""
+    if merge is not None:
+        value = f' w:val="{merge}"' if merge else ""
+        props = f"<w:tcPr><w:vMerge{value}/></w:tcPr>"
+    return f"<w:tc>{props}{content}</w:tc>"
+
+
+def _blocks(body: str) -> list[tuple[str, str, int]]:
+    return [(block.kind, block.text, block.offset) for block in iter_docx_blocks(_docx(body))]
+
+
+def test_paragraph_runs_tabs_and_breaks():
+    body = _p(_t("Name") + "<w:tab/>" + _t("Value"), "<w:br/>" + _t("next line")) + _p(_t("Second"))
+    assert _blocks(body) == [
+        ("paragraph", "Name\tValue\nnext line", 0),
+        ("paragraph", "Second", 21),
+    ]
+
+
+def test_tab_stops_in_paragraph_properties_are_ignored():
+    body = '<w:p><w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/></w:tabs></w:pPr><w:r><w:t>x</w:t></w:r></w:p>'
+    assert _blocks(body) == [("paragraph", "x", 0)]
+
+
+def test_vertically_merged_cells_are_emitted_once():
+    rows = (
+        "<w:tr>" + _tc(_p(_t("Merged")), merge="restart") + _tc(_p(_t("A"))) + "</w:tr>"
+        "<w:tr>" + _tc(_p(), merge="") + _tc(_p(_t("B"))) + "</w:tr>"
+    )
+    assert [text for _, text, _ in _blocks(f"<w:tbl>{rows}</w:tbl>")] == ["Merged", "A", "B"]
+
+
+def test_nested_table_text_is_folded_into_outer_cell():
+    inner = "<w:tbl><w:tr>" + _tc(_p(_t("inner 1"))) + _tc(_p(_t("inner 2"))) + "</w:tr></w:tbl>"
+    outer = "<w:tbl><w:tr>" + _tc(_p(_t("outer")) + inner) + "</w:tr></w:tbl>"
+    assert _blocks(outer) == [("cell", "outer\ninner 1\ninner 2", 0)]
+
+
+def test_text_box_is_read_once_after_its_anchor_paragraph():
+    text_box = _p(_t("boxed"))
+    drawing = (
+        "<mc:AlternateContent>"
+        f"<mc:Choice Requires=\"wps\"><w:drawing><w:txbxContent>{text_box}</w:txbxContent></w:drawing></mc:Choice>"
+        f"<mc:Fallback><w:pict><w:txbxContent>{text_box}</w:txbxContent></w:pict></mc:Fallback>"
+        "</mc:AlternateContent>"
+    )
+    body = _p(_t("Before "), drawing, _t("after")) + _p(_t("Tail"))
+    assert _blocks(body) == [
+        ("paragraph", "Before after", 0),
+        ("paragraph", "boxed", 13),
+        ("paragraph", "Tail", 19),
+    ]
@@ -0,0 +1,35 @@
+import asyncio
+
+import fitz
+import pytest
+
+from app.infrastructure.adapters.file_loader import DocFileLoader
+
+
+def _pdf(*pages: str) -> bytes:
+    doc = fitz.open()
+    for text in pages:
+        doc.new_page().insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+@pytest.mark.parametrize("pdf_workers", [0, 1])
+def test_pdf_text_is_read_inline_and_in_worker_processes(tmp_path, pdf_workers):
+    path = tmp_path / "policy.pdf"
+    path.write_bytes(_pdf("first page", "second page"))
+    loader = DocFileLoader(pdf_workers=pdf_workers)
+    try:
+        from_path = asyncio.run(loader.read(str(path)))
+        from_bytes = asyncio.run(loader.read_bytes(path.read_bytes(), "upload.pdf"))
+    finally:
+        loader.close()
+    assert "first page" in from_path.text and "second page" in from_path.text
+    assert from_bytes.text == from_path.text and from_bytes.source_path == "upload.pdf"
+
+
+def test_unreadable_pdf_is_reported_as_read_failure():
+    loader = DocFileLoader(pdf_workers=0)
+    with pytest.raises(RuntimeError, match="PDF read failed"):
+        asyncio.run(loader.read_bytes(b"not a pdf", "broken.pdf"))
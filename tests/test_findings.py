@@ -0,0 +1,65 @@
+import pytest
+
+from app.domain.models.compliance_report import ComplianceReport
+
+FINDINGS = [
+    {"match": "secret", "offsets": [0, 10, 20], "ends": [6, 16, 26]},
+    {"match": "data leak", "offsets": [5, 15], "ends": [14, 24]},
+]
+
+
+def _report() -> ComplianceReport:
+    return ComplianceReport(
+        summary="",
+        sentiment=None,
+        findings=FINDINGS,
+        score=80,
+        recommendations="",
+        tokens={},
+        risk_level="LOW",
+    )
+
+
+def test_full_format_pages_over_occurrences():
+    data = _report().to_dict("full", findings_offset=2, findings_limit=2)
+    assert data["findings"] == [
+        {"match": "secret", "offsets": [20], "ends": [26]},
+        {"match": "data leak", "offsets": [5], "ends": [14]},
+    ]
+    assert data["findings_page"]["total"] == 5
+
+
+def test_compact_and_summary_formats():
+    report = _report()
+    compact = report.to_dict("compact", findings_limit=4)["findings"]
+    assert compact == {
+        "rules": ["secret", "data leak"],
+        "rule_id": [0, 0, 0, 1],
+        "offset": [0, 10, 20, 5],
+        "length": [6, 6, 6, 9],
+    }
+    summary = report.to_dict("summary")
+    assert summary["findings"] == [{"match": "secret", "count": 3}, {"match": "data leak", "count": 2}]
+    assert summary["findings_page"]["total"] == 2
+
+
+def test_unknown_findings_format_is_rejected():
+    with pytest.raises(ValueError):
+        _report().to_dict("xml")
+
+
+def test_compact_lengths_are_the_matched_spans_in_the_original_text():
+    from app.domain.services.rule_engine import run_rule_checks
+
+    # "İ" lowercases to two characters, which must not shift the offsets that follow it
+    text = "İstanbul office: DATA-LEAK found"
+    rules = {"forbidden_keywords": ["data leak", "istanbul"], "match": "word"}
+    findings = run_rule_checks(text, rules)["findings"]
+    report = ComplianceReport(
+        summary="", sentiment=None, findings=findings, score=0, recommendations="", tokens={}, risk_level="HIGH"
+    )
+    compact = report.to_dict("compact")["findings"]
+    spans = [
+        text[offset : offset + length] for offset, length in zip(compact["offset"], compact["length"])
+    ]
+    assert spans == ["DATA-LEAK", "İstanbul"]
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.index.inverted_index import (
+    SQLiteInvertedIndex,
+    decode_posting,
+    decode_varints,
+    encode_posting,
+    encode_varints,
+)
+
+
+def test_varint_and_posting_codecs_round_trip():
+    values = [0, 1, 127, 128, 300, 2**21, 2**35]
+    assert decode_varints(encode_varints(values)) == values
+    assert len(encode_varints([127])) == 1 and len(encode_varints([128])) == 2
+
+    positions, offsets = [0, 3, 4, 90], [0, 17, 22, 511]
+    assert decode_posting(encode_posting(positions, offsets)) == (positions, offsets)
+
+
+def test_index_search_and_rule_evaluation_agree_with_rule_engine(tmp_path):
+    from app.domain.services.rule_engine import run_rule_checks
+
+    text = "Secret plans. The secretary keeps a data-leak log; no data leaked."
+    rules = {"forbidden_keywords": ["secret", "data leak", "leaked data"], "match": "word"}
+    index = SQLiteInvertedIndex(str(tmp_path / "index.sqlite3"))
+
+    async def scenario():
+        await index.add("doc-1", text, "policy.docx")
+        await index.add("doc-1", text, "policy.docx")  # re-adding is a no-op
+        return await index.search("data leak"), await index.evaluate_rules(rules)
+
+    try:
+        phrase_hits, evaluated = asyncio.run(scenario())
+    finally:
+        index.close()
+
+    assert phrase_hits == [{"document": "doc-1", "source": "policy.docx", "offsets": [36]}]
+    findings = run_rule_checks(text, rules)["findings"]
+    live = {finding["match"]: finding["offsets"] for finding in findings}
+    indexed = {keyword: hits[0]["offsets"] for keyword, hits in evaluated.items() if hits}
+    assert indexed == live
+
+
+def test_phrase_search_starts_from_rarest_term_and_stops_at_limit(tmp_path):
+    index = SQLiteInvertedIndex(str(tmp_path / "index.sqlite3"))
+    texts = [f"policy {i} covers the data retention rules" for i in range(600)]
+    texts[10] = "policy 10 covers data leak handling"
+    texts[550] = "a data leak in policy 550"
+
+    async def scenario():
+        for i, text in enumerate(texts):
+            await index.add(f"doc-{i}", text)
+        return (
+            await index.search("data leak"),
+            await index.search("policy", limit=3),
+            await index.search("policy unknownterm"),
+        )
+
+    try:
+        leaks, limited, missing = asyncio.run(scenario())
+        assert index._doc_counts({"data", "leak"}) == {"data": 600, "leak": 2}
+    finally:
+        index.close()
+
+    assert [(hit["document"], hit["offsets"]) for hit in leaks] == [("doc-10", [17]), ("doc-550", [2])]
+    assert [hit["document"] for hit in limited] == ["doc-0", "doc-1", "doc-2"]
+    assert missing == []
+
+
+def test_index_only_evaluates_whole_word_rule_packs(tmp_path):
+    index = SQLiteInvertedIndex(str(tmp_path / "index.sqlite3"))
+    try:
+        with pytest.raises(ValueError):
+            asyncio.run(index.evaluate_rules({"forbidden_keywords": ["password"]}))
+    finally:
+        index.close()
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from app.domain.ports.llm import LLMRequestContext
+from app.infrastructure.adapters.llm_router import RoutingLLMClient
+
+
+class _Backend:
+    def __init__(self, name: str, fail: bool = False) -> None:
+        self.name = name
+        self.fail = fail
+        self.prompts: list[str] = []
+
+    async def generate(self, prompt: str, context: LLMRequestContext | None = None) -> str:
+        self.prompts.append(prompt)
+        if self.fail:
+            raise RuntimeError(f"{self.name} unavailable")
+        return f"{self.name} output text"
+
+    def model_name(self, context: LLMRequestContext | None = None) -> str:
+        return f"{self.name}-model"
+
+
+def _router(remote_fails: bool = False) -> RoutingLLMClient:
+    return RoutingLLMClient(
+        local=_Backend("local"),
+        remote=_Backend("remote", fail=remote_fails),
+        min_chars=1000,
+        min_findings=2,
+        risk_levels="medium, HIGH",
+    )
+
+
+@pytest.mark.parametrize(
+    ("context", "expected"),
+    [
+        (None, "remote"),
+        (LLMRequestContext("summary", document_chars=999, findings=5, risk_level="LOW"), "local"),
+        (LLMRequestContext("summary", document_chars=1000, risk_level="LOW"), "remote"),
+        (LLMRequestContext("summary", document_chars=10, risk_level="high"), "remote"),
+        (LLMRequestContext("recommendations", document_chars=5000, findings=1, risk_level="LOW"), "local"),
+        (LLMRequestContext("recommendations", findings=2, risk_level="LOW"), "remote"),
+        (LLMRequestContext("recommendations", findings=0, risk_level="MEDIUM"), "remote"),
+        # a partial run has no score, so its risk is UNKNOWN and only size/findings decide
+        (LLMRequestContext("summary", document_chars=10, risk_level="UNKNOWN"), "local"),
+        (LLMRequestContext("recommendations", findings=3, risk_level="UNKNOWN"), "remote"),
+    ],
+)
+def test_route_thresholds(context, expected):
+    router = _router()
+    assert router.route(context) == expected
+    assert router.model_name(context) == f"{expected}-model"
+
+
+def test_stats_are_recorded_per_route_and_stage():
+    router = _router(remote_fails=True)
+    summary = LLMRequestContext("summary", document_chars=10, risk_level="LOW")
+    recommendations = LLMRequestContext("recommendations", findings=4, risk_level="LOW")
+
+    async def scenario():
+        await router.generate("Summarize: short", summary)
+        await router.generate("Summarize: another", summary)
+        with pytest.raises(RuntimeError):
+            await router.generate("Provide 3 compliance recommendations", recommendations)
+
+    asyncio.run(scenario())
+    stats = router.stats()
+    assert list(stats) == ["local:summary", "remote:recommendations"]
+    assert stats["local:summary"]["calls"] == 2 and stats["local:summary"]["errors"] == 0
+    assert stats["local:summary"]["input_tokens"] > 0 and stats["local:summary"]["output_tokens"] > 0
+    failed = stats["remote:recommendations"]
+    assert (failed["calls"], failed["errors"], failed["output_tokens"]) == (1, 1, 0)
+    assert failed["latency_ms_max"] >= failed["latency_ms_avg"] >= 0
@@ -0,0 +1,39 @@
+import asyncio
+
+from app.domain.services.minhash import estimate_jaccard, minhash_signature
+from app.infrastructure.cache.near_duplicates import InMemoryNearDuplicateIndex
+
+POLICY = " ".join(
+    f"clause {i} requires that confidential records are retained for {i + 3} years" for i in range(40)
+)
+
+
+def test_signatures_are_dense_and_track_similarity():
+    short = minhash_signature("one two three", num_perm=64, shingle_size=5)
+    assert len(short) == 64 and len(set(short)) == 64  # densified: no empty bins left
+    assert minhash_signature("", num_perm=64) == ()
+
+    original = minhash_signature(POLICY)
+    edited = minhash_signature(POLICY.replace("clause 7 ", "section 7 "))
+    unrelated = minhash_signature("quarterly marketing plan with new product launches " * 20)
+    assert estimate_jaccard(original, original) == 1.0
+    assert estimate_jaccard(original, edited) >= 0.8
+    assert estimate_jaccard(original, unrelated) < 0.2
+
+
+def test_lsh_lookup_returns_similar_documents_and_evicts_oldest():
+    async def scenario():
+        index = InMemoryNearDuplicateIndex(threshold=0.8, num_perm=128, bands=32, max_entries=2)
+        await index.add("policy", await index.signature(POLICY), {"summary": "s"})
+        edited = await index.find(await index.signature(POLICY.replace("clause 7 ", "section 7 ")))
+        unrelated = await index.find(await index.signature("quarterly marketing plan " * 30))
+
+        await index.add("b", await index.signature("alpha beta gamma delta epsilon " * 10), {})
+        await index.add("c", await index.signature("zeta eta theta iota kappa " * 10), {})
+        evicted = await index.find(await index.signature(POLICY))
+        return edited, unrelated, evicted
+
+    edited, unrelated, evicted = asyncio.run(scenario())
+    assert edited is not None and edited.document_id == "policy" and edited.payload == {"summary": "s"}
+    assert unrelated is None
+    assert evicted is None
@@ -0,0 +1,118 @@
+import asyncio
+
+import fitz
+
+from app.infrastructure.adapters import ocr as ocr_module
+from app.infrastructure.adapters.file_loader import DocFileLoader
+from app.infrastructure.adapters.ocr import PdfOcrFallback
+from app.infrastructure.cache.memory import InMemoryCache
+
+
+def _stub_ocr(monkeypatch) -> list[bytes]:
+    """Replace Tesseract with a stub that names each distinct image by first sight."""
+    calls: list[bytes] = []
+
+    def fake_ocr_image(png: bytes, language: str) -> str:
+        calls.append(png)
+        return f"ocr text {len(set(calls))} ({language})"
+
+    monkeypatch.setattr(ocr_module, "_ocr_image", fake_ocr_image)
+    return calls
+
+
+def _ocr(max_pages: int = 50, max_concurrent_pages: int = 2) -> PdfOcrFallback:
+    # max_workers=0 OCRs inline, so the stub is called in this process
+    return PdfOcrFallback(
+        InMemoryCache(),
+        dpi=72,
+        language="eng",
+        max_workers=0,
+        max_pages=max_pages,
+        max_concurrent_pages=max_concurrent_pages,
+    )
+
+
+def test_recognize_caches_by_image_and_survives_render_failures(monkeypatch):
+    calls = _stub_ocr(monkeypatch)
+    ocr = _ocr()
+    in_flight, peak = 0, 0
+
+    async def render(page: int) -> bytes:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if page == 2:
+            raise RuntimeError("broken page")
+        return b"same image" if page in (0, 1) else b"other image"
+
+    texts = asyncio.run(ocr.recognize([0, 1, 2, 3], render))
+
+    assert texts == ["ocr text 1 (eng)", "ocr text 1 (eng)", "", "ocr text 2 (eng)"]
+    assert calls == [b"same image", b"other image"]  # page 1 was a cache hit
+    assert peak == 1  # an inline OCR runs one page at a time whatever was asked for
+
+
+def _scanned_pdf(path, pages: int) -> None:
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "Native text page.")
+    for shade in range(pages):
+        pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 20, 20), 0)
+        pixmap.set_rect(pixmap.irect, (shade * 60, shade * 60, shade * 60))
+        doc.new_page().insert_image(fitz.Rect(50, 50, 150, 150), stream=pixmap.tobytes("png"))
+    doc.save(path)
+    doc.close()
+
+
+def test_scanned_pages_beyond_the_budget_are_reported(tmp_path, monkeypatch):
+    calls = _stub_ocr(monkeypatch)
+    path = tmp_path / "scan.pdf"
+    _scanned_pdf(path, pages=3)
+
+    document = asyncio.run(DocFileLoader(_ocr(max_pages=2), pdf_workers=0).read(str(path)))
+
+    assert document.text.startswith("Native text page.")
+    assert "ocr text 1 (eng)" in document.text and "ocr text 2 (eng)" in document.text
+    assert len(calls) == 2
+    assert document.ocr_skipped_pages == [4]  # 1-based: the native page comes first
+
+
+def test_failed_ocr_yields_empty_text_and_is_not_cached(monkeypatch):
+    attempts: list[bytes] = []
+
+    def failing_ocr_image(png: bytes, language: str) -> str:
+        attempts.append(png)
+        raise OSError("tesseract is not installed")
+
+    monkeypatch.setattr(ocr_module, "_ocr_image", failing_ocr_image)
+    ocr = _ocr()
+
+    async def render(page: int) -> bytes:
+        return b"image"
+
+    assert asyncio.run(ocr.recognize([0], render)) == [""]
+    assert asyncio.run(ocr.recognize([0], render)) == [""]
+    assert len(attempts) == 2
+
+
+def test_app_shutdown_stops_the_worker_pools(monkeypatch, tmp_path):
+    from fastapi.testclient import TestClient
+
+    from app.core.config import settings
+    from app.infrastructure import container
+    from app.main import create_app
+
+    monkeypatch.setattr(settings, "INDEX_ENABLED", False)
+    container.get_compliance_service.cache_clear()
+    path = tmp_path / "doc.pdf"
+    _scanned_pdf(path, pages=0)
+
+    with TestClient(create_app()):
+        service = container.get_compliance_service()
+        loader = service.file_loader
+        asyncio.run(loader.read(str(path)))
+        assert (loader._pool is not None) == (settings.PDF_WORKERS > 0)
+    assert loader._pool is None
+    assert loader.ocr is None or loader.ocr._pool is None
+    assert container.get_compliance_service.cache_info().currsize == 0
@@ -1,2 +1,107 @@
+import asyncio
+
+from app.application.services.compliance_service import ComplianceApplicationService
+from app.domain.models.deadline import Deadline
+from app.domain.models.document import Document
+from app.domain.ports.llm import LLMRequestContext
+from app.infrastructure.cache.memory import InMemoryCache
+
+POLICY = "Employees must keep confidential records locked. Passwords are never shared."
+RULES = {"forbidden_keywords": ["confidential"]}
+
+
+class _StubLoader:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+
+    async def read(self, path: str) -> Document:
+        await asyncio.sleep(self.delay)
+        return Document(text=POLICY, source_path=path)
+
+    async def read_bytes(self, data: bytes | bytearray, filename: str) -> Document:
+        return await self.read(filename)
+
+
+class _StubLLM:
+    def __init__(self, delays: dict[str, float] | None = None) -> None:
+        self.delays = delays or {}
+        self.calls: list[str] = []
+
+    async def generate(self, prompt: str, context: LLMRequestContext | None = None) -> str:
+        stage = context.stage if context is not None else "summary"
+        self.calls.append(stage)
+        await asyncio.sleep(self.delays.get(stage, 0.0))
+        return f"{stage} text"
+
+    def model_name(self, context: LLMRequestContext | None = None) -> str:
+        return "stub"
+
+
+def _service(llm: _StubLLM, loader: _StubLoader | None = None) -> ComplianceApplicationService:
+    return ComplianceApplicationService(
+        file_loader=loader or _StubLoader(), llm_client=llm, cache=InMemoryCache()
+    )
+
+
 def test_pipeline_dummy():
     assert True
+
+
+def test_full_run_within_budget_is_ok():
+    service = _service(_StubLLM())
+    report = asyncio.run(service.run_from_text(POLICY, RULES, deadline=Deadline.after_ms(5000)))
+    payload = report.to_dict("full")
+    assert payload["status"] == "ok" and payload["skipped_stages"] == []
+    assert report.summary == "summary text" and report.recommendations == "recommendations text"
+    assert report.score is not None and report.risk_level is not None
+
+
+def test_slow_llm_stage_is_cancelled_and_report_is_partial():
+    llm = _StubLLM(delays={"summary": 5.0})
+    report = asyncio.run(
+        _service(llm).run_from_text(POLICY, RULES, deadline=Deadline.after_ms(100))
+    )
+    payload = report.to_dict("full")
+    assert payload["status"] == "partial"
+    assert payload["skipped_stages"] == ["summary", "recommendations"]
+    # stages that finished before the deadline are still reported
+    assert report.findings and report.score is not None
+    assert report.summary == "" and llm.calls == ["summary"]
+
+
+def test_load_past_the_deadline_skips_every_stage():
+    llm = _StubLLM()
+    service = _service(llm, loader=_StubLoader(delay=5.0))
+    report = asyncio.run(service.run_from_file("policy.pdf", RULES, deadline=Deadline.after_ms(50)))
+    assert report.to_dict("full")["status"] == "partial"
+    assert report.skipped_stages == [
+        "load", "rules", "sentiment", "score", "summary", "recommendations"
+    ]
+    assert report.score is None and llm.calls == []
+
+
+def test_near_duplicate_lookup_is_bounded_by_the_deadline():
+    class SlowNearDuplicates:
+        def __init__(self) -> None:
+            self.added: list[str] = []
+
+        async def signature(self, text: str) -> tuple[int, ...]:
+            await asyncio.sleep(5.0)
+            return (1,)
+
+        async def find(self, signature):
+            return None
+
+        async def add(self, document_id, signature, payload) -> None:
+            self.added.append(document_id)
+
+    near_duplicates = SlowNearDuplicates()
+    service = ComplianceApplicationService(
+        file_loader=_StubLoader(),
+        llm_client=_StubLLM(),
+        cache=InMemoryCache(),
+        near_duplicates=near_duplicates,
+    )
+    report = asyncio.run(service.run_from_text(POLICY, RULES, deadline=Deadline.after_ms(100)))
+    assert report.skipped_stages == ["near_duplicate", "summary", "recommendations"]
+    assert report.reused_from is None and near_duplicates.added == []
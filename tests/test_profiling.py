@@ -0,0 +1,79 @@
+import asyncio
+import time
+
+from app.domain.ports.profiler import tracked
+from app.infrastructure.profiling import RequestProfiler
+
+
+def _spin(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def _request_work() -> None:
+    _spin(0.05)
+
+
+def _other_request_work() -> None:
+    _spin(0.05)
+
+
+def test_profile_covers_only_the_request_task_and_its_tracked_threads(tmp_path):
+    async def other_request() -> None:
+        await asyncio.sleep(0.01)
+        _other_request_work()
+
+    async def scenario() -> RequestProfiler:
+        profiler = RequestProfiler(str(tmp_path), interval_ms=1)
+        other = asyncio.create_task(other_request())
+        profiler.start()
+        with profiler.span("rules"):
+            await asyncio.to_thread(tracked(_request_work))
+            _request_work()
+            await asyncio.sleep(0.08)  # idle on this request while the other one runs
+        await profiler.stop()
+        await other
+        return profiler
+
+    profiler = asyncio.run(scenario())
+    folded = (tmp_path / f"{profiler.profile_id}.folded").read_text(encoding="utf-8")
+    stacks = [line.rsplit(" ", 1)[0] for line in folded.splitlines()]
+
+    assert any(stack.startswith("event-loop;stage:rules") and "_request_work" in stack for stack in stacks)
+    assert any(not stack.startswith("event-loop") and "_request_work" in stack for stack in stacks)
+    assert not any("_other_request_work" in stack for stack in stacks)
+    assert not any("select" in stack.rsplit(";", 1)[-1] for stack in stacks)
+    assert (tmp_path / f"{profiler.profile_id}.trace.json").exists()
+
+
+def test_only_the_newest_profiles_are_kept(tmp_path):
+    async def profile_once() -> str:
+        profiler = RequestProfiler(str(tmp_path), interval_ms=1, max_profiles=2)
+        profiler.start()
+        with profiler.span("rules"):
+            _request_work()
+        await profiler.stop()
+        return profiler.profile_id
+
+    ids = []
+    for _ in range(3):
+        ids.append(asyncio.run(profile_once()))
+        time.sleep(0.01)  # distinct modification times
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        f"{profile_id}{suffix}" for profile_id in ids[1:] for suffix in (".folded", ".trace.json")
+    )
+
+
+def test_profile_header_needs_the_configured_token(monkeypatch):
+    from app.api.v1.routers.compliance import get_profiler
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "PROFILE_SAMPLE_RATE", 0.0)
+    monkeypatch.setattr(settings, "PROFILE_TOKEN", "")
+    assert get_profiler("1") is None
+
+    monkeypatch.setattr(settings, "PROFILE_TOKEN", "s3cret")
+    assert get_profiler("1") is None and get_profiler(None) is None
+    assert isinstance(get_profiler("s3cret"), RequestProfiler)
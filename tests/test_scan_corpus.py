@@ -0,0 +1,47 @@
+import json
+import shutil
+
+import fitz
+
+from app.cli.scan_corpus import load_checkpoint, scan
+
+
+def _write_pdf(path, text: str) -> None:
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), text)
+    doc.save(path)
+    doc.close()
+
+
+def _records(path) -> list[dict]:
+    with path.open(encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle]
+
+
+def test_scan_checkpoints_dedupes_and_resumes(tmp_path):
+    corpus = tmp_path / "corpus"
+    (corpus / "nested").mkdir(parents=True)
+    _write_pdf(corpus / "a.pdf", "This confidential policy is reviewed yearly.")
+    _write_pdf(corpus / "nested" / "c.pdf", "Passwords are rotated every quarter.")
+    shutil.copy(corpus / "a.pdf", corpus / "b.pdf")  # same content under another name
+    (corpus / "broken.pdf").write_bytes(b"not a pdf")
+    (corpus / "notes.txt").write_text("ignored")
+
+    output, checkpoint = tmp_path / "results.jsonl", tmp_path / "results.checkpoint"
+    rules = {"forbidden_keywords": ["confidential"]}
+
+    first = scan(corpus, output, checkpoint, rules, workers=1, index_enabled=False)
+    records = _records(output)
+    assert (first.completed, first.failed, first.skipped) == (2, 1, 1)
+    assert sorted(r["path"].rsplit("/", 1)[-1] for r in records) == ["a.pdf", "broken.pdf", "c.pdf"]
+    ok = [r for r in records if r["status"] == "ok"]
+    assert load_checkpoint(checkpoint) == {r["sha256"] for r in ok}
+    assert next(r for r in ok if r["path"].endswith("a.pdf"))["report"]["findings"] == [
+        {"match": "confidential", "count": 1}
+    ]
+
+    # a rerun skips everything already checkpointed and retries only the failure
+    second = scan(corpus, output, checkpoint, rules, workers=1, index_enabled=False)
+    assert (second.completed, second.failed, second.skipped) == (0, 1, 3)
+    retried = _records(output)[len(records):]
+    assert [r["path"].rsplit("/", 1)[-1] for r in retried] == ["broken.pdf"]
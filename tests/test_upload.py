@@ -0,0 +1,90 @@
+import asyncio
+import os
+
+import pytest
+
+from app.infrastructure.adapters.upload_buffer import (
+    UploadBuffer,
+    UploadTimeoutError,
+    UploadTooLargeError,
+)
+
+
+def test_upload_buffer_spills_to_disk_and_cleans_up():
+    with UploadBuffer(".pdf", max_bytes=100, spool_bytes=4) as buffer:
+        buffer.write(b"abc")
+        assert buffer.in_memory and bytes(buffer.data) == b"abc"
+        buffer.write(b"def")
+        buffer.finish()
+        path = buffer.path
+        assert not buffer.in_memory and path.endswith(".pdf")
+        with open(path, "rb") as handle:
+            assert handle.read() == b"abcdef"
+    assert not os.path.exists(path)
+
+
+def test_upload_buffer_rejects_oversized_upload():
+    with UploadBuffer("", max_bytes=5, spool_bytes=2) as buffer:
+        buffer.write(b"abc")
+        with pytest.raises(UploadTooLargeError):
+            buffer.write(b"def")
+        path = buffer.path
+    assert path is None or not os.path.exists(path)
+
+
+def _multipart_body(boundary: str, filename: str, content: bytes, keywords: str) -> bytes:
+    return (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="forbidden_keywords"\r\n\r\n'
+        f"{keywords}\r\n"
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        "Content-Type: application/octet-stream\r\n\r\n"
+    ).encode() + content + f"\r\n--{boundary}--\r\n".encode()
+
+
+async def _chunks(body: bytes, size: int):
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+def test_multipart_reader_streams_file_part_into_buffer():
+    pytest.importorskip("python_multipart")
+    from app.infrastructure.adapters.multipart_upload import MultipartUploadReader
+
+    body = _multipart_body("xyz", "report.docx", b"0123456789" * 10, "secret, confidential")
+    with UploadBuffer("", max_bytes=1000, spool_bytes=1000) as buffer:
+        reader = MultipartUploadReader("multipart/form-data; boundary=xyz", buffer)
+        asyncio.run(reader.read(_chunks(body, 7)))
+        assert reader.filename == "report.docx"
+        assert buffer.suffix == ".docx"
+        assert reader.fields == {"forbidden_keywords": "secret, confidential"}
+        assert bytes(buffer.data) == b"0123456789" * 10
+
+
+def test_multipart_reader_stops_at_upload_limit():
+    pytest.importorskip("python_multipart")
+    from app.infrastructure.adapters.multipart_upload import MultipartUploadReader
+
+    body = _multipart_body("xyz", "big.pdf", b"x" * 500, "")
+    with UploadBuffer("", max_bytes=100, spool_bytes=50) as buffer:
+        reader = MultipartUploadReader("multipart/form-data; boundary=xyz", buffer)
+        with pytest.raises(UploadTooLargeError):
+            asyncio.run(reader.read(_chunks(body, 64)))
+        assert buffer.size <= 100 + 64
+
+
+def test_multipart_reader_gives_up_on_slow_sender():
+    pytest.importorskip("python_multipart")
+    from app.infrastructure.adapters.multipart_upload import MultipartUploadReader
+
+    async def trickle(body: bytes):
+        for start in range(0, len(body), 16):
+            await asyncio.sleep(0.05)
+            yield body[start : start + 16]
+
+    body = _multipart_body("xyz", "slow.pdf", b"x" * 200, "")
+    with UploadBuffer("", max_bytes=1000, spool_bytes=1000) as buffer:
+        reader = MultipartUploadReader("multipart/form-data; boundary=xyz", buffer)
+        with pytest.raises(UploadTimeoutError):
+            asyncio.run(reader.read(trickle(body), timeout=0.1))